@@ -2,17 +2,27 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import sys
+from dataclasses import asdict, dataclass, field, replace
 from pathlib import Path
-from typing import Dict, Optional
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional
 
-import yaml
+# PyYAML is imported lazily (see _yaml_codecs); importing this module for the
+# dataclasses alone should not pay PyYAML's import cost.
+
+# Optional fast JSON codec for the config sidecar cache.
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 
 CONFIG_SCHEMA_VERSION = "1"
 
 
-@dataclass
+@dataclass(slots=True)
 class PollingConfig:
     interval_seconds: int = 60
     jitter_pct: float = 0.1
@@ -20,7 +30,7 @@ class PollingConfig:
     stale_after_seconds: int = 300
 
 
-@dataclass
+@dataclass(slots=True)
 class CircuitBreakerConfig:
     drop_pct: float = 20.0
     drop_window_minutes: int = 15
@@ -29,7 +39,7 @@ class CircuitBreakerConfig:
     cooldown_minutes: int = 15
 
 
-@dataclass
+@dataclass(slots=True)
 class GlobalPolicy:
     settlement_lambda_days: float = 1.0
     delta_threshold: float = 0.0002
@@ -42,7 +52,7 @@ class GlobalPolicy:
     circuit_breakers: CircuitBreakerConfig = field(default_factory=CircuitBreakerConfig)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MarketPolicy:
     enabled: bool = True
     side: str = "yes"
@@ -80,123 +90,269 @@ class MarketPolicy:
         )
 
 
-@dataclass
+# Shared fallback for lookups with no configured "default" policy; callers
+# treat policies as read-only, so one instance serves every miss.
+_FALLBACK_POLICY = MarketPolicy()
+
+
+@dataclass(slots=True)
 class SimulatorConfig:
     schema_version: str = CONFIG_SCHEMA_VERSION
     mode: str = "dry_run"
     polling: PollingConfig = field(default_factory=PollingConfig)
     global_policy: GlobalPolicy = field(default_factory=GlobalPolicy)
-    market_policies: Dict[str, MarketPolicy] = field(default_factory=dict)
+    market_policies: Mapping[str, MarketPolicy] = field(default_factory=dict)
 
     def get_market_policy(self, market_id: str) -> MarketPolicy:
-        if market_id in self.market_policies:
-            return self.market_policies[market_id]
-        return self.market_policies.get("default", MarketPolicy())
+        policy = self.market_policies.get(market_id)
+        if policy is not None:
+            return policy
+        return self.market_policies.get("default") or _FALLBACK_POLICY
+
+    def set_market_policy(self, market_id: str, policy: MarketPolicy) -> None:
+        """Copy-on-write update; readers keep seeing a consistent mapping."""
+        policies = dict(self.market_policies)
+        policies[market_id] = policy
+        self.market_policies = MappingProxyType(policies)
+
+
+_YAML_CODECS = None
+
+
+def _yaml_codecs():
+    """(yaml, Loader, Dumper) imported on first use and cached.
+
+    Prefers LibYAML's C loader/dumper when compiled in; the pure-Python ones
+    otherwise.
+    """
+    global _YAML_CODECS
+    if _YAML_CODECS is None:
+        import yaml
+
+        try:
+            from yaml import CSafeLoader as loader, CSafeDumper as dumper
+        except ImportError:
+            from yaml import SafeLoader as loader, SafeDumper as dumper
+        _YAML_CODECS = (yaml, loader, dumper)
+    return _YAML_CODECS
+
 
 def _load_yaml(path: Path) -> Dict:
     if not path.exists():
         return {}
+    yaml, loader, _ = _yaml_codecs()
     with path.open("r", encoding="utf-8") as handle:
-        data = yaml.safe_load(handle) or {}
+        data = yaml.load(handle, Loader=loader) or {}
     if not isinstance(data, dict):
         raise ValueError(f"Invalid configuration format in {path}")
     return data
 
 
-def load_config(path: Path) -> SimulatorConfig:
+def _identity(value):
+    return value
+
+
+# PyYAML already yields float/int for numeric scalars; these skip the
+# redundant constructor call and only coerce on a type mismatch.
+def _as_float(value):
+    return value if type(value) is float else float(value)
+
+
+def _as_int(value):
+    return value if type(value) is int else int(value)
+
+
+def _interned_str(value):
+    return sys.intern(str(value))
+
+
+# (field, caster, default) tables driving load_config; casters run only on
+# values present in the YAML, defaults are already the right type.
+_POLLING_FIELDS = (
+    ("interval_seconds", _as_int, 60),
+    ("jitter_pct", _as_float, 0.1),
+    ("max_backoff_seconds", _as_int, 300),
+    ("stale_after_seconds", _as_int, 300),
+)
+
+_CB_FIELDS = (
+    ("drop_pct", _as_float, 20.0),
+    ("drop_window_minutes", _as_int, 15),
+    ("recovery_wait_hours", _as_float, 3.0),
+    ("volume_spike_multiplier", _as_float, 3.0),
+    ("cooldown_minutes", _as_int, 15),
+)
+
+_GLOBAL_FIELDS = (
+    ("settlement_lambda_days", _as_float, 1.0),
+    ("delta_threshold", _as_float, 0.0002),
+    ("min_g", _as_float, 0.0008),
+    ("cash_reserve_pct", _as_float, 0.07),
+    ("max_parent_allocation_pct", _as_float, 0.20),
+    ("max_month_allocation_pct", _as_float, 0.35),
+    ("slippage_cap_bps", _as_float, 40.0),
+    ("exit_slippage_cap_bps", _as_float, 40.0),
+)
+
+# slippage_cap_bps defaults to the loaded global policy's cap, patched in
+# after the table pass.
+_MARKET_FIELDS = (
+    ("enabled", _identity, True),
+    ("side", _interned_str, "yes"),
+    ("auto_buy", _identity, False),
+    ("auto_sell", _identity, True),
+    ("max_allocation_pct", _as_float, 0.20),
+    ("max_notional", _as_float, 15000.0),
+    ("per_pass_buy_cap", _as_float, 3000.0),
+    ("min_price", _as_float, 0.02),
+    ("max_price", _as_float, 0.90),
+    ("min_days", _as_float, 1.0),
+    ("max_days", _as_float, 120.0),
+    ("min_g", _as_float, 0.0008),
+    ("slippage_cap_bps", _as_float, None),
+    ("exit_slippage_cap_bps", _identity, None),
+    ("drop_freeze_pct", _as_float, 20.0),
+    ("drop_window_min", _as_int, 15),
+    ("recovery_wait_hours", _as_float, 3.0),
+    ("news_freeze", _identity, False),
+    ("priority", _as_int, 3),
+    ("whitelist_autobuy", _identity, False),
+    ("max_per_event_pct", _identity, None),
+    ("max_per_month_pct", _identity, None),
+    ("auto_buy_drop_freeze", _identity, True),
+    ("cooldown_minutes", _as_int, 15),
+)
+
+
+def _build_kwargs(raw: Dict, table) -> Dict:
+    return {name: cast(raw[name]) if name in raw else default for name, cast, default in table}
+
+
+def _load_raw_config(path: Path) -> Dict:
+    """Raw config dict, preferring a fresh JSON sidecar over the YAML scan.
+
+    JSON decodes much faster than YAML for the same shape of data; the sidecar
+    is refreshed whenever the YAML is actually parsed.
+    """
+    cache = path.with_suffix(".cache.json")
+    if ORJSON_AVAILABLE and path.exists():
+        try:
+            if cache.stat().st_mtime_ns >= path.stat().st_mtime_ns:
+                data = orjson.loads(cache.read_bytes())
+                if isinstance(data, dict):
+                    return data
+        except (OSError, ValueError):
+            pass
     raw = _load_yaml(path)
+    if ORJSON_AVAILABLE and raw:
+        try:
+            cache.write_bytes(orjson.dumps(raw))
+        except (OSError, TypeError):
+            pass
+    return raw
+
+
+def load_config(path: Path) -> SimulatorConfig:
+    raw = _load_raw_config(path)
     schema_version = raw.get("schema_version", CONFIG_SCHEMA_VERSION)
     if str(schema_version) != CONFIG_SCHEMA_VERSION:
         raise ValueError(
             f"Unsupported config schema_version={schema_version}; expected {CONFIG_SCHEMA_VERSION}."
         )
 
-    polling_raw = raw.get("polling", {})
-    polling = PollingConfig(
-        interval_seconds=int(polling_raw.get("interval_seconds", 60)),
-        jitter_pct=float(polling_raw.get("jitter_pct", 0.1)),
-        max_backoff_seconds=int(polling_raw.get("max_backoff_seconds", 300)),
-        stale_after_seconds=int(polling_raw.get("stale_after_seconds", 300)),
-    )
+    polling = PollingConfig(**_build_kwargs(raw.get("polling", {}), _POLLING_FIELDS))
 
-    cb_raw = raw.get("global", {}).get("circuit_breakers", {})
+    global_raw = raw.get("global", {})
     circuit_breakers = CircuitBreakerConfig(
-        drop_pct=float(cb_raw.get("drop_pct", 20.0)),
-        drop_window_minutes=int(cb_raw.get("drop_window_minutes", 15)),
-        recovery_wait_hours=float(cb_raw.get("recovery_wait_hours", 3.0)),
-        volume_spike_multiplier=float(cb_raw.get("volume_spike_multiplier", 3.0)),
-        cooldown_minutes=int(cb_raw.get("cooldown_minutes", 15)),
+        **_build_kwargs(global_raw.get("circuit_breakers", {}), _CB_FIELDS)
     )
-
-    global_raw = raw.get("global", {})
     global_policy = GlobalPolicy(
-        settlement_lambda_days=float(global_raw.get("settlement_lambda_days", 1.0)),
-        delta_threshold=float(global_raw.get("delta_threshold", 0.0002)),
-        min_g=float(global_raw.get("min_g", 0.0008)),
-        cash_reserve_pct=float(global_raw.get("cash_reserve_pct", 0.07)),
-        max_parent_allocation_pct=float(global_raw.get("max_parent_allocation_pct", 0.20)),
-        max_month_allocation_pct=float(global_raw.get("max_month_allocation_pct", 0.35)),
-        slippage_cap_bps=float(global_raw.get("slippage_cap_bps", 40.0)),
-        exit_slippage_cap_bps=float(global_raw.get("exit_slippage_cap_bps", 40.0)),
         circuit_breakers=circuit_breakers,
+        **_build_kwargs(global_raw, _GLOBAL_FIELDS),
     )
 
     markets_raw = raw.get("markets", {})
     market_policies: Dict[str, MarketPolicy] = {}
     for market_id, policy_raw in markets_raw.items():
-        policy = MarketPolicy(
-            enabled=policy_raw.get("enabled", True),
-            side=policy_raw.get("side", "yes"),
-            auto_buy=policy_raw.get("auto_buy", False),
-            auto_sell=policy_raw.get("auto_sell", True),
-            max_allocation_pct=float(policy_raw.get("max_allocation_pct", 0.20)),
-            max_notional=float(policy_raw.get("max_notional", 15000.0)),
-            per_pass_buy_cap=float(policy_raw.get("per_pass_buy_cap", 3000.0)),
-            min_price=float(policy_raw.get("min_price", 0.02)),
-            max_price=float(policy_raw.get("max_price", 0.90)),
-            min_days=float(policy_raw.get("min_days", 1.0)),
-            max_days=float(policy_raw.get("max_days", 120.0)),
-            min_g=float(policy_raw.get("min_g", 0.0008)),
-            slippage_cap_bps=float(policy_raw.get("slippage_cap_bps", global_policy.slippage_cap_bps)),
-            exit_slippage_cap_bps=policy_raw.get("exit_slippage_cap_bps"),
-            drop_freeze_pct=float(policy_raw.get("drop_freeze_pct", 20.0)),
-            drop_window_min=int(policy_raw.get("drop_window_min", 15)),
-            recovery_wait_hours=float(policy_raw.get("recovery_wait_hours", 3.0)),
-            news_freeze=policy_raw.get("news_freeze", False),
-            priority=int(policy_raw.get("priority", 3)),
-            whitelist_autobuy=policy_raw.get("whitelist_autobuy", False),
-            max_per_event_pct=policy_raw.get("max_per_event_pct"),
-            max_per_month_pct=policy_raw.get("max_per_month_pct"),
-            auto_buy_drop_freeze=policy_raw.get("auto_buy_drop_freeze", True),
-            cooldown_minutes=int(policy_raw.get("cooldown_minutes", 15)),
-        )
-        market_policies[market_id] = policy
+        kwargs = _build_kwargs(policy_raw, _MARKET_FIELDS)
+        if kwargs["slippage_cap_bps"] is None:
+            kwargs["slippage_cap_bps"] = global_policy.slippage_cap_bps
+        # Interned ids/sides compare by pointer in the hot evaluation loop.
+        market_policies[sys.intern(str(market_id))] = MarketPolicy(**kwargs)
+    # Policies are frozen and the mapping read-only: safe to share across
+    # threads without defensive copies; updates go through set_market_policy.
 
     config = SimulatorConfig(
         schema_version=CONFIG_SCHEMA_VERSION,
-        mode=raw.get("mode", "dry_run"),
+        mode=sys.intern(str(raw.get("mode", "dry_run"))),
         polling=polling,
         global_policy=global_policy,
-        market_policies=market_policies,
+        market_policies=MappingProxyType(market_policies),
     )
     return config
 
 
+# Parsed configs keyed by path, tagged with (st_mtime_ns, st_size) so repeat
+# calls skip the YAML parse while the file on disk is unchanged.
+_CONFIG_CACHE: Dict[Path, tuple] = {}
+
+
 def ensure_config(path: Path) -> SimulatorConfig:
-    if not path.exists():
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
         default = SimulatorConfig(
-            market_policies={"default": MarketPolicy()},
+            market_policies=MappingProxyType({"default": MarketPolicy()}),
         )
         save_config(default, path)
         return default
-    return load_config(path)
+    cached = _CONFIG_CACHE.get(path)
+    if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        return cached[2]
+    config = load_config(path)
+    _CONFIG_CACHE[path] = (stat.st_mtime_ns, stat.st_size, config)
+    return config
 
 
-def validate_config(config: SimulatorConfig) -> None:
-    def ensure(condition: bool, message: str) -> None:
-        if not condition:
-            raise ValueError(message)
+# Per-market validation predicates built once; the error string is only
+# assembled on failure.
+_MARKET_CHECKS = (
+    (lambda p: 0 <= p.max_allocation_pct <= 1, "max_allocation_pct must be between 0 and 1."),
+    (lambda p: p.max_notional >= 0, "max_notional must be non-negative."),
+    (lambda p: p.per_pass_buy_cap >= 0, "per_pass_buy_cap must be non-negative."),
+    (lambda p: 0 <= p.min_price <= 1, "min_price must be between 0 and 1."),
+    (lambda p: 0 <= p.max_price <= 1, "max_price must be between 0 and 1."),
+    (lambda p: p.min_price <= p.max_price, "min_price must be <= max_price."),
+    (lambda p: p.min_days >= 0, "min_days must be non-negative."),
+    (lambda p: p.max_days >= p.min_days, "max_days must be >= min_days."),
+    (lambda p: p.min_g >= 0, "min_g must be non-negative."),
+    (lambda p: p.slippage_cap_bps >= 0, "slippage_cap_bps must be non-negative."),
+    (
+        lambda p: p.exit_slippage_cap_bps is None or p.exit_slippage_cap_bps >= 0,
+        "exit_slippage_cap_bps must be non-negative.",
+    ),
+    (
+        lambda p: p.max_per_event_pct is None or 0 <= p.max_per_event_pct <= 1,
+        "max_per_event_pct must be between 0 and 1.",
+    ),
+    (
+        lambda p: p.max_per_month_pct is None or 0 <= p.max_per_month_pct <= 1,
+        "max_per_month_pct must be between 0 and 1.",
+    ),
+    (lambda p: p.drop_freeze_pct >= 0, "drop_freeze_pct must be non-negative."),
+    (lambda p: p.drop_window_min >= 0, "drop_window_min must be non-negative."),
+    (lambda p: p.recovery_wait_hours >= 0, "recovery_wait_hours must be non-negative."),
+    (lambda p: p.cooldown_minutes >= 0, "cooldown_minutes must be non-negative."),
+)
+
+
+def _ensure(condition: bool, message: str) -> None:
+    if not condition:
+        raise ValueError(message)
 
+
+def validate_config(config: SimulatorConfig) -> None:
+    ensure = _ensure
     polling = config.polling
     ensure(polling.interval_seconds >= 5, "Polling interval_seconds must be at least 5 seconds.")
     ensure(polling.jitter_pct >= 0, "Polling jitter_pct must be non-negative.")
@@ -226,85 +382,20 @@ def validate_config(config: SimulatorConfig) -> None:
     ensure(cb.cooldown_minutes >= 0, "Circuit breaker cooldown_minutes must be non-negative.")
 
     for market_id, policy in config.market_policies.items():
-        prefix = f"Market '{market_id}': "
-        ensure(0 <= policy.max_allocation_pct <= 1, prefix + "max_allocation_pct must be between 0 and 1.")
-        ensure(policy.max_notional >= 0, prefix + "max_notional must be non-negative.")
-        ensure(policy.per_pass_buy_cap >= 0, prefix + "per_pass_buy_cap must be non-negative.")
-        ensure(0 <= policy.min_price <= 1, prefix + "min_price must be between 0 and 1.")
-        ensure(0 <= policy.max_price <= 1, prefix + "max_price must be between 0 and 1.")
-        ensure(policy.min_price <= policy.max_price, prefix + "min_price must be <= max_price.")
-        ensure(policy.min_days >= 0, prefix + "min_days must be non-negative.")
-        ensure(policy.max_days >= policy.min_days, prefix + "max_days must be >= min_days.")
-        ensure(policy.min_g >= 0, prefix + "min_g must be non-negative.")
-        ensure(policy.slippage_cap_bps >= 0, prefix + "slippage_cap_bps must be non-negative.")
-        if policy.exit_slippage_cap_bps is not None:
-            ensure(policy.exit_slippage_cap_bps >= 0, prefix + "exit_slippage_cap_bps must be non-negative.")
-        if policy.max_per_event_pct is not None:
-            ensure(0 <= policy.max_per_event_pct <= 1, prefix + "max_per_event_pct must be between 0 and 1.")
-        if policy.max_per_month_pct is not None:
-            ensure(0 <= policy.max_per_month_pct <= 1, prefix + "max_per_month_pct must be between 0 and 1.")
-        ensure(policy.drop_freeze_pct >= 0, prefix + "drop_freeze_pct must be non-negative.")
-        ensure(policy.drop_window_min >= 0, prefix + "drop_window_min must be non-negative.")
-        ensure(policy.recovery_wait_hours >= 0, prefix + "recovery_wait_hours must be non-negative.")
-        ensure(policy.cooldown_minutes >= 0, prefix + "cooldown_minutes must be non-negative.")
+        for predicate, message in _MARKET_CHECKS:
+            if not predicate(policy):
+                raise ValueError(f"Market '{market_id}': {message}")
 
 
 def save_config(config: SimulatorConfig, path: Path) -> None:
     validate_config(config)
-    data = {
-        "schema_version": config.schema_version,
-        "mode": config.mode,
-        "polling": {
-            "interval_seconds": config.polling.interval_seconds,
-            "jitter_pct": config.polling.jitter_pct,
-            "max_backoff_seconds": config.polling.max_backoff_seconds,
-            "stale_after_seconds": config.polling.stale_after_seconds,
-        },
-        "global": {
-            "settlement_lambda_days": config.global_policy.settlement_lambda_days,
-            "delta_threshold": config.global_policy.delta_threshold,
-            "min_g": config.global_policy.min_g,
-            "cash_reserve_pct": config.global_policy.cash_reserve_pct,
-            "max_parent_allocation_pct": config.global_policy.max_parent_allocation_pct,
-            "max_month_allocation_pct": config.global_policy.max_month_allocation_pct,
-            "slippage_cap_bps": config.global_policy.slippage_cap_bps,
-            "exit_slippage_cap_bps": config.global_policy.exit_slippage_cap_bps,
-            "circuit_breakers": {
-                "drop_pct": config.global_policy.circuit_breakers.drop_pct,
-                "drop_window_minutes": config.global_policy.circuit_breakers.drop_window_minutes,
-                "recovery_wait_hours": config.global_policy.circuit_breakers.recovery_wait_hours,
-                "volume_spike_multiplier": config.global_policy.circuit_breakers.volume_spike_multiplier,
-                "cooldown_minutes": config.global_policy.circuit_breakers.cooldown_minutes,
-            },
-        },
-        "markets": {},
-    }
-    for market_id, policy in config.market_policies.items():
-        data["markets"][market_id] = {
-            "enabled": policy.enabled,
-            "side": policy.side,
-            "auto_buy": policy.auto_buy,
-            "auto_sell": policy.auto_sell,
-            "max_allocation_pct": policy.max_allocation_pct,
-            "max_notional": policy.max_notional,
-            "per_pass_buy_cap": policy.per_pass_buy_cap,
-            "min_price": policy.min_price,
-            "max_price": policy.max_price,
-            "min_days": policy.min_days,
-            "max_days": policy.max_days,
-            "min_g": policy.min_g,
-            "slippage_cap_bps": policy.slippage_cap_bps,
-            "exit_slippage_cap_bps": policy.exit_slippage_cap_bps,
-            "drop_freeze_pct": policy.drop_freeze_pct,
-            "drop_window_min": policy.drop_window_min,
-            "recovery_wait_hours": policy.recovery_wait_hours,
-            "news_freeze": policy.news_freeze,
-            "priority": policy.priority,
-            "whitelist_autobuy": policy.whitelist_autobuy,
-            "max_per_event_pct": policy.max_per_event_pct,
-            "max_per_month_pct": policy.max_per_month_pct,
-            "auto_buy_drop_freeze": policy.auto_buy_drop_freeze,
-            "cooldown_minutes": policy.cooldown_minutes,
-        }
+    # asdict recurses through the nested dataclasses in one C-assisted pass;
+    # only the top-level keys differ from the dataclass field names. The
+    # mapping proxy is rewrapped as a plain dict so asdict can recurse it.
+    data = asdict(replace(config, market_policies=dict(config.market_policies)))
+    data["global"] = data.pop("global_policy")
+    data["global"]["circuit_breakers"] = data["global"].pop("circuit_breakers")
+    data["markets"] = data.pop("market_policies")
     with path.open("w", encoding="utf-8") as handle:
-        yaml.safe_dump(data, handle, sort_keys=False)
+        yaml, _, dumper = _yaml_codecs()
+        yaml.dump(data, handle, Dumper=dumper, sort_keys=False)
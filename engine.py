@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from functools import lru_cache
 from math import log1p
 from typing import Dict, List, Optional, Tuple
 
@@ -40,6 +41,7 @@ def _ln1p(value: float) -> float:
     return log1p(value)
 
 
+@lru_cache(maxsize=16384)
 def compute_g(price: Optional[float], resolution_days: float, lambda_days: float) -> Optional[float]:
     if price is None or price <= 0 or resolution_days + lambda_days <= 0:
         return None
@@ -47,6 +49,15 @@ def compute_g(price: Optional[float], resolution_days: float, lambda_days: float
     return _ln1p(r) / (resolution_days + lambda_days)
 
 
+def compute_g_many(
+    markets: List[MarketState],
+    lambda_days: float,
+    _compute_g=compute_g,
+) -> List[Optional[float]]:
+    """g for each market's best ask in one pass with the lookups pre-bound."""
+    return [_compute_g(market.best_ask, market.resolution_days, lambda_days) for market in markets]
+
+
 def compute_fill_from_asks(
     asks: List[List[float]],
     max_value: float,
@@ -108,9 +119,13 @@ def evaluate_market_candidate(
     market: MarketState,
     policy: MarketPolicy,
     global_policy: GlobalPolicy,
+    g: Optional[float] = None,
 ) -> CandidateOpportunity:
     best_ask = market.best_ask
-    g = compute_g(best_ask, market.resolution_days, global_policy.settlement_lambda_days)
+    if g is None:
+        # Callers may pass a g precomputed by compute_g_many; recomputing
+        # here is only a (cached) fallback for direct invocations.
+        g = compute_g(best_ask, market.resolution_days, global_policy.settlement_lambda_days)
     reasons: List[str] = []
     status = "eligible"
     if not policy.enabled:
@@ -154,9 +169,11 @@ class AllocationEngine:
     def evaluate(self, state: RuntimeState) -> EngineResult:
         now_iso = _now_iso()
         result = EngineResult(timestamp=now_iso)
-        for market in state.list_markets():
+        markets = state.list_markets()
+        g_values = compute_g_many(markets, self.config.global_policy.settlement_lambda_days)
+        for market, g in zip(markets, g_values):
             policy = self.config.get_market_policy(market.market_id)
-            opportunity = evaluate_market_candidate(market, policy, self.config.global_policy)
+            opportunity = evaluate_market_candidate(market, policy, self.config.global_policy, g=g)
             result.opportunities.append(opportunity)
             if opportunity.status != "eligible":
                 result.rejections.append(
@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 import json
+import pickle
 import random
+import shutil
+import threading
 from dataclasses import replace
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
@@ -12,6 +15,12 @@ from typing import Dict, List, Optional
 import tkinter as tk
 from tkinter import filedialog, messagebox, simpledialog, ttk
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from config_manager import MarketPolicy, SimulatorConfig, ensure_config, load_config, save_config
 from engine import AllocationEngine
 from polymarket_api import (
@@ -30,6 +39,7 @@ from runtime_state import (
     RuntimeState,
     parse_volume,
     extract_parent_event,
+    write_binary_atomic,
     _now,
     _now_iso,
     _parse_iso,
@@ -38,10 +48,63 @@ from runtime_state import (
 CONFIG_PATH = Path("config.yaml")
 RUNTIME_PATH = Path("runtime_state.json")
 DEFAULT_BUDGET = 50000.0
+AUTOSAVE_FLUSH_MS = 2000
+
+_TRADE_LOG_HEADER = (
+    "timestamp",
+    "mode",
+    "action",
+    "market_id",
+    "question",
+    "outcome",
+    "shares",
+    "price",
+    "value",
+    "g_before",
+    "g_after",
+    "slippage_bps",
+    "reasons",
+)
+
+
+def _int_from_entry(raw: str) -> int:
+    return int(float(raw))
+
+
+# (policy attribute, caster, optional) — drives save_market_settings parsing.
+MARKET_NUMERIC_FIELDS = (
+    ("priority", int, False),
+    ("min_g", float, False),
+    ("min_price", float, False),
+    ("max_price", float, False),
+    ("min_days", float, False),
+    ("max_days", float, False),
+    ("max_allocation_pct", float, False),
+    ("max_per_event_pct", float, True),
+    ("max_per_month_pct", float, True),
+    ("max_notional", float, False),
+    ("per_pass_buy_cap", float, False),
+    ("slippage_cap_bps", float, False),
+    ("exit_slippage_cap_bps", float, True),
+    ("drop_freeze_pct", float, False),
+    ("drop_window_min", _int_from_entry, False),
+    ("recovery_wait_hours", float, False),
+    ("cooldown_minutes", _int_from_entry, False),
+)
 
 
-def format_currency(value: float) -> str:
-    return f"${value:,.2f}"
+def _top_of_book(order_book: Dict, side: str) -> Optional[float]:
+    """Best price on a book side without allocating a default level."""
+    levels = order_book.get(side)
+    return levels[0][0] if levels else None
+
+
+# Pre-bound format methods: cheaper than re-parsing f-string specs in row loops.
+_fmt3 = "{:.3f}".format
+_fmt6 = "{:.6f}".format
+_fmt2 = "{:.2f}".format
+_fmt_shares = "{:,.2f}".format
+format_currency = "${:,.2f}".format
 
 
 def format_percent(value: float) -> str:
@@ -230,8 +293,8 @@ class AddMarketDialog(simpledialog.Dialog):
             messagebox.showerror("Order book error", str(exc))
             return
 
-        best_ask = snapshot.order_book.get("asks", [[None]])[0][0] if snapshot.order_book.get("asks") else None
-        best_bid = snapshot.order_book.get("bids", [[None]])[0][0] if snapshot.order_book.get("bids") else None
+        best_ask = _top_of_book(snapshot.order_book, "asks")
+        best_bid = _top_of_book(snapshot.order_book, "bids")
 
         asks_text = "\n".join(
             [f"  {price:.3f} for {size:,.2f}" for price, size in snapshot.order_book.get("asks", [])[:10]]
@@ -280,12 +343,30 @@ class PolymarketApp(tk.Tk):
 
         self.sim_config_path = CONFIG_PATH
         self.runtime_path = RUNTIME_PATH
+        self.runtime_binary_path = RUNTIME_PATH.with_suffix(".pkl")
         self.sim_config: SimulatorConfig = ensure_config(self.sim_config_path)
 
+        self._save_cond = threading.Condition()
+        self._pending_save: Optional[Dict] = None
+        self._state_dirty = False
+        self._save_shutdown = False
+        self._save_thread = threading.Thread(target=self._save_worker, daemon=True)
+        self._save_thread.start()
+
         self.state = self._load_or_create_state()
         self.engine = AllocationEngine(self.sim_config)
 
         self.latest_evaluation = None
+        self._eval_cache = None
+        self._eval_cache_version = -1
+        self._watchlist_row_cache: Dict[str, tuple] = {}
+        self._opportunity_row_cache: Dict[str, tuple] = {}
+        self._holdings_row_cache: Dict[str, tuple] = {}
+        self._holdings_fmt_cache: Dict[str, tuple] = {}
+        self._timeline_key: Optional[tuple] = None
+        self._markets_cache: Optional[List[MarketState]] = None
+        self._markets_cache_version = -1
+        self._dirty_views: set = set()
         self.trading_enabled = tk.BooleanVar(value=True)
         self.state.mode = "live"
         self.mode = "live"
@@ -294,30 +375,97 @@ class PolymarketApp(tk.Tk):
         self.poll_backoff_seconds: Optional[int] = None
         self._loading_market_form = False
 
+        # Created in _build_layout; initialized here so guards are plain None checks.
+        self.watchlist_tree: Optional[ttk.Treeview] = None
+        self.market_selector: Optional[ttk.Combobox] = None
+        # Shadow of market_selector values for O(1) membership checks.
+        self._policy_ids: set = set()
+
         self._build_menu()
         self._build_layout()
         self.refresh_views()
         self._schedule_poll(initial=True)
+        self.after(AUTOSAVE_FLUSH_MS, self._flush_state_timer)
 
     def _load_or_create_state(self) -> RuntimeState:
-        if self.runtime_path.exists():
+        if self.runtime_binary_path.exists():
+            try:
+                state = RuntimeState.load_binary(self.runtime_binary_path)
+            except Exception:
+                # Corrupt/truncated pickle: fall back to the JSON state file
+                # rather than crashing every startup.
+                if not self.runtime_path.exists():
+                    raise
+                state = RuntimeState.load(self.runtime_path)
+        elif self.runtime_path.exists():
+            # Migration path: older installs only have the JSON state file.
             state = RuntimeState.load(self.runtime_path)
         else:
             budget_dialog = NewBudgetDialog(self)
             total_budget = float(budget_dialog.result) if budget_dialog.result else DEFAULT_BUDGET
             state = RuntimeState(total_budget=total_budget, cash_balance=total_budget, mode="live")
-            state.filepath = self.runtime_path
-            state.save(self.runtime_path)
+            state.filepath = self.runtime_binary_path
+            state.save_binary(self.runtime_binary_path)
 
         if state.mode != "live":
             state.mode = "live"
             try:
-                state.save(self.runtime_path)
+                state.save_binary(self.runtime_binary_path)
             except Exception:
                 pass
 
         return state
 
+    def _autosave_state(self) -> None:
+        """Mark state dirty; the periodic flush timer performs the actual save.
+
+        Mutation sites stay O(1) — the to_dict snapshot and disk write are
+        amortized over the flush interval instead of paid per mutation.
+        """
+        self._state_dirty = True
+
+    def _flush_state_timer(self) -> None:
+        if self._state_dirty:
+            self._state_dirty = False
+            # Snapshot on the main thread so the writer never races mutations;
+            # back-to-back flushes overwrite the pending payload.
+            with self._save_cond:
+                self._pending_save = self.state.to_dict()
+                self._save_cond.notify()
+        self.after(AUTOSAVE_FLUSH_MS, self._flush_state_timer)
+
+    def _save_worker(self) -> None:
+        while True:
+            with self._save_cond:
+                while self._pending_save is None and not self._save_shutdown:
+                    self._save_cond.wait()
+                payload = self._pending_save
+                self._pending_save = None
+                shutting_down = self._save_shutdown
+            if payload is not None:
+                try:
+                    write_binary_atomic(
+                        self.runtime_binary_path,
+                        pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL),
+                    )
+                except Exception:
+                    pass
+            if shutting_down:
+                return
+
+    def destroy(self) -> None:
+        # Hand the final payload to the worker and join it: a single writer
+        # means the shutdown flush can never interleave with an in-flight
+        # autosave on the shared temp file.
+        with self._save_cond:
+            if self._state_dirty:
+                self._state_dirty = False
+                self._pending_save = self.state.to_dict()
+            self._save_shutdown = True
+            self._save_cond.notify()
+        self._save_thread.join(timeout=5.0)
+        super().destroy()
+
     def _build_menu(self) -> None:
         menu_bar = tk.Menu(self)
         file_menu = tk.Menu(menu_bar, tearoff=False)
@@ -350,6 +498,7 @@ class PolymarketApp(tk.Tk):
 
         self.notebook = ttk.Notebook(self)
         self.notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=(0, 10))
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
 
         self._build_overview_tab()
         self._build_opportunities_tab()
@@ -640,6 +789,7 @@ class PolymarketApp(tk.Tk):
         self.global_vars["exit_slippage"].set(f"{gp.exit_slippage_cap_bps}")
 
         market_ids = sorted(self.sim_config.market_policies.keys())
+        self._policy_ids = set(market_ids)
         self.market_selector["values"] = tuple(market_ids)
         if market_ids:
             if self.market_selector.get() not in market_ids:
@@ -654,12 +804,10 @@ class PolymarketApp(tk.Tk):
             return self.sim_config.market_policies[market_id]
         base_policy = self.sim_config.market_policies.get("default")
         policy = replace(base_policy) if base_policy else MarketPolicy()
-        self.sim_config.market_policies[market_id] = policy
-        if hasattr(self, "market_selector"):
-            values = list(self.market_selector["values"])
-            if market_id not in values:
-                values.append(market_id)
-                self.market_selector["values"] = tuple(sorted(values))
+        self.sim_config.set_market_policy(market_id, policy)
+        if self.market_selector is not None and market_id not in self._policy_ids:
+            self._policy_ids.add(market_id)
+            self.market_selector["values"] = tuple(sorted(self._policy_ids))
         return policy
 
     def clear_market_form(self) -> None:
@@ -713,25 +861,26 @@ class PolymarketApp(tk.Tk):
             return
         policy = self.ensure_policy_for_market(market_id)
         value = self.market_bool_vars[field].get()
-        setattr(policy, field, value)
+        self.sim_config.set_market_policy(market_id, replace(policy, **{field: value}))
         try:
             save_config(self.sim_config, self.sim_config_path)
         except ValueError as exc:
             messagebox.showerror("Config validation failed", str(exc))
             # revert toggle
             self._loading_market_form = True
-            setattr(policy, field, not value)
+            self.sim_config.set_market_policy(market_id, policy)
             self.market_bool_vars[field].set(not value)
             self._loading_market_form = False
             return
         self.status_var.set(
             f"{field.replace('_', ' ').title()} {'enabled' if value else 'disabled'} for {market_id}."
         )
-        self.update_opportunities_view()
-        self.update_overview()
+        self._invalidate_evaluation_cache()
+        self._dirty_views.update(("opportunities", "overview"))
+        self._flush_visible_views()
 
     def save_global_settings(self) -> None:
-        current_policy = self.market_selector.get() if hasattr(self, "market_selector") else ""
+        current_policy = self.market_selector.get() if self.market_selector is not None else ""
         try:
             gp = self.sim_config.global_policy
             gp.settlement_lambda_days = float(self.global_vars["lambda"].get())
@@ -755,7 +904,7 @@ class PolymarketApp(tk.Tk):
             except Exception:
                 pass
             return
-        self.reload_config()
+        self._rebuild_engine()
         if current_policy and current_policy in self.sim_config.market_policies:
             self.market_selector.set(current_policy)
             self.load_market_settings()
@@ -767,35 +916,17 @@ class PolymarketApp(tk.Tk):
             messagebox.showerror("Market settings", "Select a market policy first.")
             return
         policy = self.ensure_policy_for_market(market_id)
+        changes = {}
         try:
-            policy.priority = int(self.market_vars["priority"].get())
-            policy.min_g = float(self.market_vars["min_g"].get())
-            policy.min_price = float(self.market_vars["min_price"].get())
-            policy.max_price = float(self.market_vars["max_price"].get())
-            policy.min_days = float(self.market_vars["min_days"].get())
-            policy.max_days = float(self.market_vars["max_days"].get())
-            policy.max_allocation_pct = float(self.market_vars["max_allocation_pct"].get())
-            policy.max_notional = float(self.market_vars["max_notional"].get())
-            policy.per_pass_buy_cap = float(self.market_vars["per_pass_buy_cap"].get())
-            policy.slippage_cap_bps = float(self.market_vars["slippage_cap_bps"].get())
-            exit_slip = self.market_vars["exit_slippage_cap_bps"].get().strip()
-            policy.exit_slippage_cap_bps = float(exit_slip) if exit_slip else None
-            policy.drop_freeze_pct = float(self.market_vars["drop_freeze_pct"].get())
-            policy.drop_window_min = int(float(self.market_vars["drop_window_min"].get()))
-            policy.recovery_wait_hours = float(self.market_vars["recovery_wait_hours"].get())
-            max_event = self.market_vars["max_per_event_pct"].get().strip()
-            policy.max_per_event_pct = float(max_event) if max_event else None
-            max_month = self.market_vars["max_per_month_pct"].get().strip()
-            policy.max_per_month_pct = float(max_month) if max_month else None
-            policy.cooldown_minutes = int(float(self.market_vars["cooldown_minutes"].get()))
+            for name, caster, optional in MARKET_NUMERIC_FIELDS:
+                raw = self.market_vars[name].get().strip()
+                changes[name] = None if optional and not raw else caster(raw)
         except ValueError as exc:
             messagebox.showerror("Invalid input", f"Market settings error: {exc}")
             return
-        policy.auto_buy = self.market_bool_vars["auto_buy"].get()
-        policy.auto_sell = self.market_bool_vars["auto_sell"].get()
-        policy.news_freeze = self.market_bool_vars["news_freeze"].get()
-        policy.whitelist_autobuy = self.market_bool_vars["whitelist_autobuy"].get()
-        policy.auto_buy_drop_freeze = self.market_bool_vars["auto_buy_drop_freeze"].get()
+        for name in ("auto_buy", "auto_sell", "news_freeze", "whitelist_autobuy", "auto_buy_drop_freeze"):
+            changes[name] = self.market_bool_vars[name].get()
+        self.sim_config.set_market_policy(market_id, replace(policy, **changes))
         try:
             save_config(self.sim_config, self.sim_config_path)
         except ValueError as exc:
@@ -806,11 +937,11 @@ class PolymarketApp(tk.Tk):
             except Exception:
                 pass
             return
-        self.reload_config()
+        self._rebuild_engine()
         self.market_selector.set(market_id)
         self.load_market_settings()
-        self.update_opportunities_view()
-        self.update_overview()
+        self._dirty_views.update(("opportunities", "overview"))
+        self._flush_visible_views()
         self.status_var.set(f"Market policy '{market_id}' saved.")
     def reset_simulation(self) -> None:
         dialog = NewBudgetDialog(self)
@@ -818,8 +949,9 @@ class PolymarketApp(tk.Tk):
             return
         budget = float(dialog.result)
         self.state = RuntimeState(total_budget=budget, cash_balance=budget, mode="live")
-        self.state.filepath = self.runtime_path
-        self.state.save(self.runtime_path)
+        self.state.filepath = self.runtime_binary_path
+        self._autosave_state()
+        self._invalidate_evaluation_cache()
         self.mode = "live"
         self.mode_label_var.set("Live")
         self.refresh_views()
@@ -832,14 +964,16 @@ class PolymarketApp(tk.Tk):
         try:
             self.state = RuntimeState.load(Path(path))
             self.runtime_path = Path(path)
+            self.runtime_binary_path = self.runtime_path.with_suffix(".pkl")
             if self.state.mode != "live":
                 self.state.mode = "live"
                 try:
-                    self.state.save(self.runtime_path)
+                    self._autosave_state()
                 except Exception:
                     pass
             self.mode = "live"
             self.mode_label_var.set("Live")
+            self._invalidate_evaluation_cache()
             self.refresh_views()
             self.status_var.set(f"Loaded runtime state from {path}.")
         except Exception as exc:
@@ -853,12 +987,17 @@ class PolymarketApp(tk.Tk):
         except Exception as exc:
             messagebox.showerror("Save failed", f"Unable to save runtime state: {exc}")
 
+    def _rebuild_engine(self) -> None:
+        """Rebuild the engine from the in-memory config without re-reading disk."""
+        self.engine = AllocationEngine(self.sim_config)
+        self._invalidate_evaluation_cache()
+        self.refresh_views()
+
     def reload_config(self) -> None:
         try:
             self.sim_config = load_config(self.sim_config_path)
-            self.engine = AllocationEngine(self.sim_config)
+            self._rebuild_engine()
             self.status_var.set("Configuration reloaded.")
-            self.refresh_views()
         except Exception as exc:
             messagebox.showerror("Config error", f"Unable to reload config: {exc}")
 
@@ -932,8 +1071,8 @@ class PolymarketApp(tk.Tk):
                     continue
                 raise RuntimeError(f"Failed to fetch {market.market_id}: {exc}") from exc
             descriptor = get_outcome_descriptor(snapshot.raw_metadata, market.outcome)
-            best_ask = snapshot.order_book.get("asks", [[None]])[0][0] if snapshot.order_book.get("asks") else None
-            best_bid = snapshot.order_book.get("bids", [[None]])[0][0] if snapshot.order_book.get("bids") else None
+            best_ask = _top_of_book(snapshot.order_book, "asks")
+            best_bid = _top_of_book(snapshot.order_book, "bids")
             market.update_from_snapshot(
                 snapshot=snapshot,
                 last_price=descriptor.last_price,
@@ -945,7 +1084,9 @@ class PolymarketApp(tk.Tk):
             market.parent_event_id = parent_event_id
             market.parent_event_label = parent_event_label
             self._evaluate_circuit_breakers(market)
-        self.state.save(self.runtime_path)
+        if markets:
+            self.state.mark_changed()
+        self._autosave_state()
         if self.trading_enabled.get():
             self.run_allocation(auto=True, refresh=False)
         self.refresh_views()
@@ -961,36 +1102,28 @@ class PolymarketApp(tk.Tk):
             window_minutes = policy.drop_window_min or global_policy.circuit_breakers.drop_window_minutes
             drop_pct = policy.drop_freeze_pct or global_policy.circuit_breakers.drop_pct
             window_start = now - timedelta(minutes=window_minutes)
-            samples = []
-            for sample in market.price_history:
-                try:
-                    sample_time = _parse_iso(sample.timestamp)
-                except Exception:
-                    continue
-                if sample_time >= window_start:
-                    samples.append(sample)
-            if samples:
-                oldest = samples[0]
-                if oldest.best_ask and oldest.best_ask > 0:
-                    drop = (oldest.best_ask - market.best_ask) / oldest.best_ask * 100
-                    if drop >= drop_pct:
-                        until = now + timedelta(
-                            hours=policy.recovery_wait_hours or global_policy.circuit_breakers.recovery_wait_hours
-                        )
-                        self.state.set_freeze(
-                            market.key(),
-                            FreezeStatus(
-                                reason="price_drop",
-                                activated_at=_now_iso(),
-                                until=until.isoformat(timespec="seconds") + "Z",
-                                details={"drop_pct": drop},
-                            ),
-                        )
-                        return
+            oldest_ask = market.oldest_ask_since(window_start)
+            if oldest_ask and oldest_ask > 0:
+                drop = (oldest_ask - market.best_ask) / oldest_ask * 100
+                if drop >= drop_pct:
+                    until = now + timedelta(
+                        hours=policy.recovery_wait_hours or global_policy.circuit_breakers.recovery_wait_hours
+                    )
+                    self.state.set_freeze(
+                        market.key(),
+                        FreezeStatus(
+                            reason="price_drop",
+                            activated_at=_now_iso(),
+                            until=until.isoformat(timespec="seconds") + "Z",
+                            details={"drop_pct": drop},
+                        ),
+                    )
+                    return
 
         volume = market.last_volume or 0.0
-        if volume and len(market.price_history) >= 2:
-            previous_volume = market.price_history[-2].volume or 0.0
+        previous_sample_volume = market.previous_volume() if volume else None
+        if previous_sample_volume is not None:
+            previous_volume = previous_sample_volume or 0.0
             if previous_volume > 0:
                 multiplier = global_policy.circuit_breakers.volume_spike_multiplier
                 if volume / previous_volume >= multiplier:
@@ -1004,18 +1137,51 @@ class PolymarketApp(tk.Tk):
                             details={"volume_ratio": volume / previous_volume},
                         ),
                     )
+    # Notebook tab order; names key the dirty-view bookkeeping.
+    _VIEW_NAMES = ("overview", "opportunities", "holdings", "decisions", "config")
+
     def refresh_views(self) -> None:
         self.state.ensure_cash()
-        self.update_opportunities_view()
-        self.update_overview()
-        self.update_holdings_view()
-        self.update_decisions_view()
-        self.update_config_view()
+        self._dirty_views.update(self._VIEW_NAMES)
+        self._flush_visible_views()
+
+    def _active_view_name(self) -> Optional[str]:
+        try:
+            return self._VIEW_NAMES[self.notebook.index(self.notebook.select())]
+        except Exception:
+            return None
+
+    def _flush_visible_views(self) -> None:
+        """Render only the visible tab; hidden tabs stay dirty until selected."""
+        active = self._active_view_name()
+        if active in self._dirty_views:
+            self._dirty_views.discard(active)
+            self._render_view(active)
+
+    def _on_tab_changed(self, _event=None) -> None:
+        self._flush_visible_views()
+
+    def _render_view(self, name: str) -> None:
+        if name == "overview":
+            self.update_overview()
+        elif name == "opportunities":
+            self.update_opportunities_view()
+        elif name == "holdings":
+            self.update_holdings_view()
+        elif name == "decisions":
+            self.update_decisions_view()
+        elif name == "config":
+            self.update_config_view()
 
     def update_overview(self) -> None:
-        total_invested = sum(market.invested_amount() for market in self.state.list_markets())
-        realized = sum(market.realized_profit for market in self.state.list_markets())
-        portfolio_value = self.state.cash_balance + sum(market.market_value() for market in self.state.list_markets())
+        total_invested = 0.0
+        realized = 0.0
+        holdings_value = 0.0
+        for market in self._sorted_markets():
+            total_invested += market.invested_amount()
+            realized += market.realized_profit
+            holdings_value += market.market_value()
+        portfolio_value = self.state.cash_balance + holdings_value
         age_seconds = self.state.max_data_age_seconds()
 
         self.summary_labels["total_budget"].set(format_currency(self.state.total_budget))
@@ -1028,19 +1194,29 @@ class PolymarketApp(tk.Tk):
         )
 
         self._refresh_watchlist_table()
-
+        self._rebuild_timeline()
+
+    def _rebuild_timeline(self) -> None:
+        exposures_by_month, counts_by_month = self.state.month_aggregates()
+        # Key on both aggregates (counts can move while exposure stays put,
+        # e.g. unheld markets) and keep the tuple itself rather than its
+        # hash so a collision can never skip a repaint.
+        timeline_key = (
+            tuple(sorted(exposures_by_month.items())),
+            tuple(sorted(counts_by_month.items())),
+        )
+        if timeline_key == self._timeline_key:
+            return
+        self._timeline_key = timeline_key
         self.timeline_tree.delete(*self.timeline_tree.get_children())
-        exposures_by_month: Dict[str, float] = {}
-        counts_by_month: Dict[str, int] = {}
-        for market in self.state.list_markets():
-            key = market.resolution_month()
-            exposures_by_month.setdefault(key, 0.0)
-            exposures_by_month[key] += market.market_value()
-            counts_by_month.setdefault(key, 0)
-            counts_by_month[key] += 1
-        for month, exposure in sorted(exposures_by_month.items()):
-            count = counts_by_month.get(month, 0)
-            self.timeline_tree.insert("", tk.END, values=(month, format_currency(exposure), count))
+        show_option = self.timeline_tree.cget("show")
+        self.timeline_tree.configure(show="")
+        try:
+            for month, exposure in sorted(exposures_by_month.items()):
+                count = counts_by_month.get(month, 0)
+                self.timeline_tree.insert("", tk.END, values=(month, format_currency(exposure), count))
+        finally:
+            self.timeline_tree.configure(show=show_option)
 
     def on_watchlist_select(self, *_args) -> None:
         selection = self.watchlist_tree.selection()
@@ -1054,11 +1230,9 @@ class PolymarketApp(tk.Tk):
         if market.market_id not in self.sim_config.market_policies:
             self.ensure_policy_for_market(market.market_id)
             policy_created = True
-        values = list(self.market_selector["values"])
-        if market.market_id not in values:
-            values.append(market.market_id)
-            values = sorted(values)
-            self.market_selector["values"] = tuple(values)
+        if market.market_id not in self._policy_ids:
+            self._policy_ids.add(market.market_id)
+            self.market_selector["values"] = tuple(sorted(self._policy_ids))
         if policy_created:
             try:
                 save_config(self.sim_config, self.sim_config_path)
@@ -1067,16 +1241,45 @@ class PolymarketApp(tk.Tk):
         self.market_selector.set(market.market_id)
         self.load_market_settings()
 
+    @staticmethod
+    def _apply_tree_rows(tree: ttk.Treeview, row_cache: Dict[str, tuple], rows: List[tuple]) -> None:
+        """Diff desired rows against the tree, touching only widgets that changed."""
+        existing = set(tree.get_children(""))
+        # Full (re)population: suppress redraw while the batch of inserts runs
+        # so Tk paints once at the end instead of reflowing per row.
+        bulk_insert = not existing and len(rows) > 1
+        show_option = tree.cget("show") if bulk_insert else None
+        if bulk_insert:
+            tree.configure(show="")
+        try:
+            desired: List[str] = []
+            for index, (iid, values, tags) in enumerate(rows):
+                desired.append(iid)
+                if iid not in existing:
+                    tree.insert("", index, iid=iid, values=values, tags=tags)
+                    row_cache[iid] = (values, tags)
+                elif row_cache.get(iid) != (values, tags):
+                    tree.item(iid, values=values, tags=tags)
+                    row_cache[iid] = (values, tags)
+            for iid in existing.difference(desired):
+                tree.delete(iid)
+                row_cache.pop(iid, None)
+            if list(tree.get_children("")) != desired:
+                for index, iid in enumerate(desired):
+                    tree.move(iid, "", index)
+        finally:
+            if bulk_insert:
+                tree.configure(show=show_option)
+
     def _refresh_watchlist_table(self) -> None:
-        if not hasattr(self, "watchlist_tree"):
+        if self.watchlist_tree is None:
             return
-        self.watchlist_tree.delete(*self.watchlist_tree.get_children())
-        evaluation_map: Dict[str, object] = {}
-        if self.latest_evaluation:
-            evaluation_map = {opp.market_key: opp for opp in self.latest_evaluation.opportunities}
+        evaluation = self._ensure_evaluation()
+        evaluation_map = {opp.market_key: opp for opp in evaluation.opportunities}
         now_dt = _now()
         stale_threshold = self.sim_config.polling.stale_after_seconds
-        for market in sorted(self.state.list_markets(), key=lambda m: (m.question.lower(), m.outcome.lower())):
+        rows: List[tuple] = []
+        for market in self._sorted_markets():
             opportunity = evaluation_map.get(market.key())
             freeze = self.state.get_freeze(market.key())
             status_key = "tracked"
@@ -1111,9 +1314,9 @@ class PolymarketApp(tk.Tk):
                 if held_tag_needed:
                     status_label += " + Holding"
 
-            shares_display = f"{market.held_shares:,.2f}"
-            best_ask_display = f"{market.best_ask:.3f}" if market.best_ask is not None else "-"
-            g_display = f"{g_value:.6f}" if g_value is not None else "-"
+            shares_display = _fmt_shares(market.held_shares)
+            best_ask_display = _fmt3(market.best_ask) if market.best_ask is not None else "-"
+            g_display = _fmt6(g_value) if g_value is not None else "-"
             notes_display = "; ".join(notes) if notes else ""
             updated_display = "never"
             tags = set()
@@ -1132,40 +1335,49 @@ class PolymarketApp(tk.Tk):
                         tags.add("stale")
                 except Exception:
                     updated_display = market.last_fetch_ts
-            self.watchlist_tree.insert(
-                "",
-                tk.END,
-                iid=market.key(),
-                values=(
-                    market.question,
-                    market.outcome,
-                    shares_display,
-                    best_ask_display,
-                    g_display,
-                    status_label,
-                    notes_display,
-                    updated_display,
-                ),
-                tags=tuple(tags),
+            rows.append(
+                (
+                    market.key(),
+                    (
+                        market.question,
+                        market.outcome,
+                        shares_display,
+                        best_ask_display,
+                        g_display,
+                        status_label,
+                        notes_display,
+                        updated_display,
+                    ),
+                    tuple(sorted(tags)),
+                )
             )
+        self._apply_tree_rows(self.watchlist_tree, self._watchlist_row_cache, rows)
+
+    def _invalidate_evaluation_cache(self) -> None:
+        self._eval_cache = None
+        self._eval_cache_version = -1
+        self._markets_cache = None
+        self._markets_cache_version = -1
+
+    def _sorted_markets(self) -> List[MarketState]:
+        """Markets sorted for display, recomputed only when the state version moves."""
+        if self._markets_cache is None or self._markets_cache_version != self.state._version:
+            self._markets_cache = sorted(
+                self.state.list_markets(), key=lambda m: (m.question.lower(), m.outcome.lower())
+            )
+            self._markets_cache_version = self.state._version
+        return self._markets_cache
 
-        self.timeline_tree.delete(*self.timeline_tree.get_children())
-        exposures_by_month: Dict[str, float] = {}
-        counts_by_month: Dict[str, int] = {}
-        for market in self.state.list_markets():
-            key = market.resolution_month()
-            exposures_by_month.setdefault(key, 0.0)
-            exposures_by_month[key] += market.market_value()
-            counts_by_month.setdefault(key, 0)
-            counts_by_month[key] += 1
-        for month, exposure in sorted(exposures_by_month.items()):
-            count = counts_by_month.get(month, 0)
-            self.timeline_tree.insert("", tk.END, values=(month, format_currency(exposure), count))
+    def _ensure_evaluation(self):
+        if self._eval_cache is None or self.state._version != self._eval_cache_version:
+            self._eval_cache = self.engine.evaluate(self.state)
+            self._eval_cache_version = self.state._version
+        self.latest_evaluation = self._eval_cache
+        return self._eval_cache
 
     def update_opportunities_view(self) -> None:
-        result = self.engine.evaluate(self.state)
-        self.latest_evaluation = result
-        self.opportunity_tree.delete(*self.opportunity_tree.get_children())
+        result = self._ensure_evaluation()
+        rows: List[tuple] = []
         for opp in result.opportunities:
             tags: List[str] = []
             if opp.status == "eligible":
@@ -1174,79 +1386,93 @@ class PolymarketApp(tk.Tk):
                 tags.append("blocked")
                 if any(reason.startswith("freeze") for reason in opp.reasons):
                     tags.append("freeze")
-            self.opportunity_tree.insert(
-                "",
-                tk.END,
-                iid=opp.market_key,
-                values=(
-                    opp.question,
-                    opp.outcome,
-                    f"{opp.best_ask:.3f}" if opp.best_ask else "-",
-                    f"{opp.g:.6f}" if opp.g is not None else "-",
-                    f"{opp.slippage_bps:.2f}" if opp.slippage_bps is not None else "-",
-                    opp.status,
-                    ", ".join(opp.reasons),
-                ),
-                tags=tuple(tags),
+            rows.append(
+                (
+                    opp.market_key,
+                    (
+                        opp.question,
+                        opp.outcome,
+                        _fmt3(opp.best_ask) if opp.best_ask else "-",
+                        _fmt6(opp.g) if opp.g is not None else "-",
+                        _fmt2(opp.slippage_bps) if opp.slippage_bps is not None else "-",
+                        opp.status,
+                        ", ".join(opp.reasons),
+                    ),
+                    tuple(tags),
+                )
             )
+        self._apply_tree_rows(self.opportunity_tree, self._opportunity_row_cache, rows)
 
     def update_holdings_view(self) -> None:
-        self.holdings_tree.delete(*self.holdings_tree.get_children())
         lambda_days = self.sim_config.global_policy.settlement_lambda_days
+        rows: List[tuple] = []
         for market in self.state.engaged_markets():
+            key = market.key()
             g_held = market.g_held(lambda_days)
-            self.holdings_tree.insert(
-                "",
-                tk.END,
-                iid=market.key(),
-                values=(
+            market_value = market.market_value()
+            raw = (
+                market.question,
+                market.outcome,
+                market.held_shares,
+                market.average_price,
+                market.best_bid,
+                market.best_ask,
+                market_value,
+                g_held,
+            )
+            cached = self._holdings_fmt_cache.get(key)
+            if cached is not None and cached[0] == raw:
+                values = cached[1]
+            else:
+                values = (
                     market.question,
                     market.outcome,
-                    f"{market.held_shares:,.2f}",
-                    f"{market.average_price:.3f}" if market.average_price else "-",
-                    f"{market.best_bid:.3f}" if market.best_bid else "-",
-                    f"{market.best_ask:.3f}" if market.best_ask else "-",
-                    format_currency(market.market_value()),
-                    f"{g_held:.6f}" if g_held is not None else "-",
-                ),
-            )
+                    _fmt_shares(market.held_shares),
+                    _fmt3(market.average_price) if market.average_price else "-",
+                    _fmt3(market.best_bid) if market.best_bid else "-",
+                    _fmt3(market.best_ask) if market.best_ask else "-",
+                    format_currency(market_value),
+                    _fmt6(g_held) if g_held is not None else "-",
+                )
+                self._holdings_fmt_cache[key] = (raw, values)
+            rows.append((key, values, ()))
+        self._apply_tree_rows(self.holdings_tree, self._holdings_row_cache, rows)
 
     def update_decisions_view(self) -> None:
-        self.decisions_text.configure(state="normal")
-        self.decisions_text.delete("1.0", tk.END)
         decision = self.state.last_decision
         if not decision:
-            self.decisions_text.insert(tk.END, "No decisions yet.")
+            content = "No decisions yet."
         else:
-            self.decisions_text.insert(tk.END, f"Last run: {decision.timestamp}\n\n")
-            self.decisions_text.insert(tk.END, "Buys:\n")
+            # Build the full report in Python and hand Tk a single insert.
+            parts: List[str] = [f"Last run: {decision.timestamp}\n", "Buys:"]
             if decision.buys:
-                for buy in decision.buys:
-                    self.decisions_text.insert(
-                        tk.END,
-                        f"  + {buy['market_id']} ({buy['outcome']}): {buy['shares']:,.2f} @ {buy['price']:.3f}"
-                        f" (slip {buy.get('slippage_bps', 0):.2f}bps, g={buy.get('g', '-')})\n",
-                    )
+                parts.extend(
+                    f"  + {buy['market_id']} ({buy['outcome']}): {buy['shares']:,.2f} @ {buy['price']:.3f}"
+                    f" (slip {buy.get('slippage_bps', 0):.2f}bps, g={buy.get('g', '-')})"
+                    for buy in decision.buys
+                )
             else:
-                self.decisions_text.insert(tk.END, "  none\n")
-            self.decisions_text.insert(tk.END, "\nSells:\n")
+                parts.append("  none")
+            parts.append("\nSells:")
             if decision.sells:
-                for sell in decision.sells:
-                    self.decisions_text.insert(
-                        tk.END,
-                        f"  - {sell['market_id']} ({sell['outcome']}): {sell['shares']:,.2f} @ {sell['price']:.3f}"
-                        f" (slip {sell.get('slippage_bps', 0):.2f}bps)\n",
-                    )
+                parts.extend(
+                    f"  - {sell['market_id']} ({sell['outcome']}): {sell['shares']:,.2f} @ {sell['price']:.3f}"
+                    f" (slip {sell.get('slippage_bps', 0):.2f}bps)"
+                    for sell in decision.sells
+                )
             else:
-                self.decisions_text.insert(tk.END, "  none\n")
-            self.decisions_text.insert(tk.END, "\nTop rejections:\n")
+                parts.append("  none")
+            parts.append("\nTop rejections:")
             for rejection in decision.rejections[:5]:
                 reasons = ", ".join(rejection.get("reasons", []))
-                self.decisions_text.insert(
-                    tk.END,
+                parts.append(
                     f"  * {rejection['market_id']} ({rejection['outcome']}): {reasons}"
-                    f" (g={rejection.get('g', '-')})\n",
+                    f" (g={rejection.get('g', '-')})"
                 )
+            content = "\n".join(parts) + "\n"
+        self.decisions_text.configure(state="normal")
+        self.decisions_text.delete("1.0", tk.END)
+        self.decisions_text.insert(tk.END, content)
         self.decisions_text.configure(state="disabled")
 
     def update_config_view(self) -> None:
@@ -1260,7 +1486,7 @@ class PolymarketApp(tk.Tk):
             return
         try:
             self.state.add_market(market_state)
-            self.state.save(self.runtime_path)
+            self._autosave_state()
             created_policy = market_state.market_id not in self.sim_config.market_policies
             if created_policy:
                 self.ensure_policy_for_market(market_state.market_id)
@@ -1285,14 +1511,14 @@ class PolymarketApp(tk.Tk):
             return
         try:
             self.state.remove_market(selection)
-            self.state.save(self.runtime_path)
+            self._autosave_state()
             self.refresh_views()
             self.status_var.set(f"Removed {selection}.")
         except ValueError as exc:
             messagebox.showerror("Remove failed", str(exc))
 
     def _selected_market_key(self) -> Optional[str]:
-        if hasattr(self, "watchlist_tree"):
+        if self.watchlist_tree is not None:
             selection = self.watchlist_tree.selection()
             if selection:
                 return selection[0]
@@ -1318,9 +1544,10 @@ class PolymarketApp(tk.Tk):
                     return
         try:
             result = self.engine.execute(self.state, mode=self.mode)
+            self.state.mark_changed()
             self.state.cash_balance = max(self.state.cash_balance, 0.0)
             self.state.mode = self.mode
-            self.state.save(self.runtime_path)
+            self._autosave_state()
             if refresh:
                 self.refresh_views()
             if auto:
@@ -1347,44 +1574,34 @@ class PolymarketApp(tk.Tk):
         if not path:
             return
         import csv
-
-        with open(path, "w", newline="", encoding="utf-8") as handle:
+        import operator
+
+        # Pre-bound attrgetter hoists the attribute lookups out of the loop;
+        # writerows over a generator keeps the hot path inside the csv module.
+        get = operator.attrgetter(
+            "timestamp",
+            "mode",
+            "action",
+            "market_id",
+            "question",
+            "outcome",
+            "shares",
+            "price",
+            "value",
+        )
+        with open(path, "w", newline="", encoding="utf-8", buffering=1 << 20) as handle:
             writer = csv.writer(handle)
-            writer.writerow(
-                [
-                    "timestamp",
-                    "mode",
-                    "action",
-                    "market_id",
-                    "question",
-                    "outcome",
-                    "shares",
-                    "price",
-                    "value",
-                    "g_before",
-                    "g_after",
-                    "slippage_bps",
-                    "reasons",
-                ]
-            )
-            for entry in self.state.trade_log:
-                writer.writerow(
-                    [
-                        entry.timestamp,
-                        entry.mode,
-                        entry.action,
-                        entry.market_id,
-                        entry.question,
-                        entry.outcome,
-                        entry.shares,
-                        entry.price,
-                        entry.value,
-                        entry.g_before if entry.g_before is not None else "",
-                        entry.g_after if entry.g_after is not None else "",
-                        entry.slippage_bps if entry.slippage_bps is not None else "",
-                        ";".join(entry.reasons),
-                    ]
+            writer.writerow(_TRADE_LOG_HEADER)
+            writer.writerows(
+                get(entry)
+                + (
+                    entry.g_before if entry.g_before is not None else "",
+                    entry.g_after if entry.g_after is not None else "",
+                    entry.slippage_bps if entry.slippage_bps is not None else "",
+                    ";".join(entry.reasons),
                 )
+                for entry in self.state.trade_log
+            )
         self.status_var.set(f"Trade log exported to {path}.")
 
     def export_log_ndjson(self) -> None:
@@ -1395,10 +1612,19 @@ class PolymarketApp(tk.Tk):
         )
         if not path:
             return
-        with open(path, "w", encoding="utf-8") as handle:
-            for entry in self.state.trade_log:
-                handle.write(json.dumps(entry.__dict__))
-                handle.write("\n")
+        sidecar = self.state.ensure_trade_sidecar()
+        if sidecar is not None and sidecar.exists():
+            with open(sidecar, "rb") as src, open(path, "wb") as dst:
+                shutil.copyfileobj(src, dst)
+        elif ORJSON_AVAILABLE:
+            # One buffered writelines call instead of two writes per entry.
+            with open(path, "wb", buffering=1 << 20) as handle:
+                handle.writelines(orjson.dumps(entry.__dict__) + b"\n" for entry in self.state.trade_log)
+        else:
+            with open(path, "wb", buffering=1 << 20) as handle:
+                handle.writelines(
+                    json.dumps(entry.__dict__).encode("utf-8") + b"\n" for entry in self.state.trade_log
+                )
         self.status_var.set(f"Trade log exported to {path}.")
 
 def main() -> None:
@@ -4,14 +4,28 @@ from __future__ import annotations
 
 import copy
 import json
-from dataclasses import dataclass, field, asdict
+import os
+import pickle
+import sys
+from array import array
+from bisect import bisect_left
+from collections import deque
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import BinaryIO, Dict, List, Optional, Tuple
 
 from polymarket_api import MarketSnapshot
 from math import log1p as math_log1p
 
+# Optional fast JSON codec; the stdlib is used when it is not installed.
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 def parse_volume(metadata: Dict) -> Optional[float]:
     volume = metadata.get("volumeNum") or metadata.get("volume")
@@ -37,6 +51,21 @@ def extract_parent_event(metadata: Dict) -> (str, str):
 
 RUNTIME_SCHEMA_VERSION = "1"
 
+# Ring-buffer size for per-market price history; bounds both the
+# circuit-breaker scan window and the persisted payload.
+HISTORY_MAXLEN = 240
+TRADE_LOG_MAXLEN = 5000
+
+# MarketState attributes that are rebuilt at load time and never persisted.
+_MARKET_RUNTIME_FIELDS = (
+    "_history_epochs",
+    "_resolution_month",
+    "_g_cache",
+    "_last_fetch_dt",
+    "_market_value_cache",
+    "_snapshot_cache",
+)
+
 
 def _now() -> datetime:
     return datetime.now(timezone.utc)
@@ -50,13 +79,49 @@ def _floor_month(date: datetime) -> str:
     return date.strftime("%Y-%m")
 
 
+@lru_cache(maxsize=2048)
+def _month_of_iso(iso: str) -> str:
+    """Month bucket for an ISO timestamp; cached since resolution dates repeat."""
+    return _floor_month(_parse_iso(iso))
+
+
+def write_binary_atomic(target: Path, payload: bytes) -> None:
+    """Write payload to a sibling temp file, fsync, and os.replace into place."""
+    tmp = target.with_name(target.name + ".tmp")
+    with open(tmp, "wb") as handle:
+        handle.write(payload)
+        handle.flush()
+        os.fsync(handle.fileno())
+    os.replace(tmp, target)
+
+
+# fromisoformat accepts a trailing "Z" natively from 3.11 on, skipping the
+# per-call string copy the replace() fallback needs.
+_ISO_Z_NATIVE = sys.version_info >= (3, 11)
+
+
+@lru_cache(maxsize=16384)
 def _parse_iso(value: str) -> datetime:
-    dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if not _ISO_Z_NATIVE:
+        value = value.replace("Z", "+00:00")
+    dt = datetime.fromisoformat(value)
     if dt.tzinfo is None:
         dt = dt.replace(tzinfo=timezone.utc)
     return dt.astimezone(timezone.utc)
 
 
+_NAN = float("nan")
+
+
+def _pack_opt(value: Optional[float]) -> float:
+    """Missing floats are stored as NaN inside the typed history arrays."""
+    return _NAN if value is None else value
+
+
+def _unpack_opt(value: float) -> Optional[float]:
+    return None if value != value else value
+
+
 @dataclass
 class PriceSample:
     timestamp: str
@@ -89,9 +154,13 @@ class FreezeStatus:
     activated_at: str
     until: str
     details: Dict = field(default_factory=dict)
+    # Parsed twin of until; freeze scans compare datetimes directly.
+    _until_dt: Optional[datetime] = field(default=None, repr=False, compare=False)
 
     def is_active(self, now: datetime) -> bool:
-        return now < _parse_iso(self.until)
+        if self._until_dt is None:
+            self._until_dt = _parse_iso(self.until)
+        return now < self._until_dt
 
 
 @dataclass
@@ -109,24 +178,63 @@ class MarketState:
     last_price: Optional[float] = None
     last_volume: Optional[float] = None
     order_book: Dict[str, List[List[float]]] = field(default_factory=lambda: {"asks": [], "bids": []})
-    price_history: List[PriceSample] = field(default_factory=list)
     held_shares: float = 0.0
     average_price: Optional[float] = None
     realized_profit: float = 0.0
     last_fetch_ts: Optional[str] = None
     next_buy_time: Optional[str] = None
+    # Price history as parallel ring buffers (struct-of-arrays): ISO
+    # timestamps plus float32 ask/bid/volume columns with NaN for missing
+    # values. Typed arrays hold raw machine floats, dropping the ~100 bytes
+    # of object overhead a PriceSample would cost per sample.
+    _ph_ts: List[str] = field(default_factory=list, repr=False, compare=False)
+    _ph_ask: array = field(default_factory=lambda: array("f"), repr=False, compare=False)
+    _ph_bid: array = field(default_factory=lambda: array("f"), repr=False, compare=False)
+    _ph_vol: array = field(default_factory=lambda: array("f"), repr=False, compare=False)
+    # Epoch-seconds twin of _ph_ts for bisect lookups; rebuilt on load.
+    _history_epochs: array = field(default_factory=lambda: array("d"), repr=False, compare=False)
+    # Month bucket of resolution_datetime, computed lazily and dropped
+    # whenever resolution_datetime changes.
+    _resolution_month: Optional[str] = field(default=None, repr=False, compare=False)
+    # Memoized g_held: ((average_price, resolution_days, lambda_days), g).
+    _g_cache: Optional[Tuple[Tuple, Optional[float]]] = field(default=None, repr=False, compare=False)
+    # Parsed twin of last_fetch_ts so age checks skip the ISO round trip.
+    _last_fetch_dt: Optional[datetime] = field(default=None, repr=False, compare=False)
+    # market_value memo, dropped whenever prices or holdings change.
+    _market_value_cache: Optional[float] = field(default=None, repr=False, compare=False)
+    # Serialized form of this market, reused across saves until it mutates.
+    _snapshot_cache: Optional[Dict] = field(default=None, repr=False, compare=False)
 
     def key(self) -> str:
         return f"{self.market_id}|{self.outcome}"
 
+    @property
+    def price_history(self) -> List[PriceSample]:
+        """Materialized view of the columnar history, oldest sample first."""
+        return [
+            PriceSample(ts, _unpack_opt(ask), _unpack_opt(bid), _unpack_opt(vol))
+            for ts, ask, bid, vol in zip(self._ph_ts, self._ph_ask, self._ph_bid, self._ph_vol)
+        ]
+
+    def previous_volume(self) -> Optional[float]:
+        """Volume of the second-most-recent sample; None with fewer than two."""
+        if len(self._ph_vol) < 2:
+            return None
+        return _unpack_opt(self._ph_vol[-2])
+
     def resolution_month(self) -> str:
-        return _floor_month(_parse_iso(self.resolution_datetime))
+        if self._resolution_month is None:
+            self._resolution_month = _month_of_iso(self.resolution_datetime)
+        return self._resolution_month
 
     def market_value(self) -> float:
-        if self.held_shares <= 0:
-            return 0.0
-        benchmark = self.best_bid or self.last_price or self.average_price or 0.0
-        return self.held_shares * benchmark
+        if self._market_value_cache is None:
+            if self.held_shares <= 0:
+                self._market_value_cache = 0.0
+            else:
+                benchmark = self.best_bid or self.last_price or self.average_price or 0.0
+                self._market_value_cache = self.held_shares * benchmark
+        return self._market_value_cache
 
     def invested_amount(self) -> float:
         if self.held_shares <= 0 or self.average_price is None:
@@ -145,7 +253,10 @@ class MarketState:
     def g_held(self, lambda_days: float) -> Optional[float]:
         if self.held_shares <= 0 or not self.average_price:
             return None
-        return self.g_for_price(self.average_price, lambda_days)
+        key = (self.average_price, self.resolution_days, lambda_days)
+        if self._g_cache is None or self._g_cache[0] != key:
+            self._g_cache = (key, self.g_for_price(self.average_price, lambda_days))
+        return self._g_cache[1]
 
     def update_from_snapshot(
         self,
@@ -157,6 +268,12 @@ class MarketState:
     ) -> None:
         self.question = snapshot.question
         self.resolution_datetime = snapshot.resolution_datetime.isoformat()
+        # Derive the month bucket straight from the datetime, skipping a
+        # re-parse of the string we just produced.
+        res_dt = snapshot.resolution_datetime
+        if res_dt.tzinfo is None:
+            res_dt = res_dt.replace(tzinfo=timezone.utc)
+        self._resolution_month = _floor_month(res_dt.astimezone(timezone.utc))
         self.resolution_days = snapshot.resolution_days
         self.metadata = snapshot.raw_metadata
         self.order_book = {
@@ -167,13 +284,39 @@ class MarketState:
         self.best_bid = best_bid
         self.last_price = last_price
         self.last_volume = volume
-        self.last_fetch_ts = _now_iso()
-        self.price_history.append(
-            PriceSample(timestamp=self.last_fetch_ts, best_ask=best_ask, best_bid=best_bid, volume=volume)
-        )
-        # keep limited history
-        if len(self.price_history) > 240:
-            self.price_history = self.price_history[-240:]
+        self._market_value_cache = None
+        self._snapshot_cache = None
+        fetch_dt = _now()
+        self._last_fetch_dt = fetch_dt
+        self.last_fetch_ts = fetch_dt.isoformat(timespec="seconds").replace("+00:00", "Z")
+        self._ph_ts.append(self.last_fetch_ts)
+        self._ph_ask.append(_pack_opt(best_ask))
+        self._ph_bid.append(_pack_opt(best_bid))
+        self._ph_vol.append(_pack_opt(volume))
+        self._history_epochs.append(fetch_dt.timestamp())
+        # Bounded ring: evict the oldest sample across all columns.
+        if len(self._ph_ts) > HISTORY_MAXLEN:
+            del self._ph_ts[0]
+            del self._ph_ask[0]
+            del self._ph_bid[0]
+            del self._ph_vol[0]
+            del self._history_epochs[0]
+
+    def _rebuild_history_index(self) -> None:
+        self._history_epochs = array("d")
+        for ts in self._ph_ts:
+            try:
+                epoch = _parse_iso(ts).timestamp()
+            except Exception:
+                epoch = 0.0
+            self._history_epochs.append(epoch)
+
+    def oldest_ask_since(self, window_start: datetime) -> Optional[float]:
+        """Best ask of the oldest sample at/after window_start (bisect, not a scan)."""
+        idx = bisect_left(self._history_epochs, window_start.timestamp())
+        if idx >= len(self._ph_ask):
+            return None
+        return _unpack_opt(self._ph_ask[idx])
 
     def buy(self, shares: float, price: float) -> None:
         if shares <= 0:
@@ -185,6 +328,8 @@ class MarketState:
             current_cost = self.average_price * self.held_shares
             self.average_price = (current_cost + total_cost) / (self.held_shares + shares)
         self.held_shares += shares
+        self._market_value_cache = None
+        self._snapshot_cache = None
 
     def sell(self, shares: float, price: float) -> float:
         shares = min(shares, self.held_shares)
@@ -197,6 +342,8 @@ class MarketState:
             self.held_shares = 0.0
             self.average_price = None
         self.realized_profit += proceeds - cost_basis
+        self._market_value_cache = None
+        self._snapshot_cache = None
         return proceeds
 
 
@@ -216,11 +363,20 @@ class RuntimeState:
     cash_balance: float = 0.0
     markets: Dict[str, MarketState] = field(default_factory=dict)
     strategy_priority: List[str] = field(default_factory=list)
-    trade_log: List[TradeLogEntry] = field(default_factory=list)
+    trade_log: "deque[TradeLogEntry]" = field(default_factory=lambda: deque(maxlen=TRADE_LOG_MAXLEN))
     active_freezes: Dict[str, FreezeStatus] = field(default_factory=dict)
     last_decision: Optional[DecisionRecord] = None
     mode: str = "live"
     filepath: Optional[Path] = None
+    _version: int = 0
+    _month_aggregates: Optional[Tuple[Dict[str, float], Dict[str, int]]] = field(
+        default=None, repr=False, compare=False
+    )
+    _month_aggregates_version: int = field(default=-1, repr=False, compare=False)
+    _event_exposures: Optional[Dict[str, float]] = field(default=None, repr=False, compare=False)
+    _trade_sidecar_handle: Optional[BinaryIO] = field(default=None, repr=False, compare=False)
+    _sidecar_lines: int = field(default=0, repr=False, compare=False)
+    _dirty: bool = field(default=False, repr=False, compare=False)
 
     # --- Persistence -------------------------------------------------
 
@@ -231,12 +387,11 @@ class RuntimeState:
             "cash_balance": self.cash_balance,
             "markets": {key: self._market_to_dict(mkt) for key, mkt in self.markets.items()},
             "strategy_priority": self.strategy_priority,
-            "trade_log": [asdict(entry) for entry in self.trade_log],
-            "active_freezes": {
-                key: {"reason": freeze.reason, "activated_at": freeze.activated_at, "until": freeze.until, "details": freeze.details}
-                for key, freeze in self.active_freezes.items()
-            },
-            "last_decision": asdict(self.last_decision) if self.last_decision else None,
+            # __dict__ avoids asdict's deep copy of reasons/metadata; shallow
+            # sharing is safe because callers serialize the result immediately.
+            "trade_log": [entry.__dict__ for entry in self.trade_log],
+            "active_freezes": {key: self._freeze_to_dict(freeze) for key, freeze in self.active_freezes.items()},
+            "last_decision": self.last_decision.__dict__ if self.last_decision else None,
             "mode": self.mode,
         }
 
@@ -248,7 +403,10 @@ class RuntimeState:
             cash_balance=data.get("cash_balance", 0.0),
             markets={key: RuntimeState._market_from_dict(value) for key, value in data.get("markets", {}).items()},
             strategy_priority=data.get("strategy_priority", []),
-            trade_log=[TradeLogEntry(**entry) for entry in data.get("trade_log", [])],
+            trade_log=deque(
+                (TradeLogEntry(**entry) for entry in data.get("trade_log", [])),
+                maxlen=TRADE_LOG_MAXLEN,
+            ),
             active_freezes={
                 key: FreezeStatus(
                     reason=value["reason"],
@@ -272,14 +430,47 @@ class RuntimeState:
         if not target:
             raise ValueError("No filepath supplied for saving runtime state.")
         target = Path(target)
-        target.write_text(json.dumps(self.to_dict(), indent=2))
+        if ORJSON_AVAILABLE:
+            payload = orjson.dumps(self.to_dict(), option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(self.to_dict(), indent=2).encode("utf-8")
+        write_binary_atomic(target, payload)
         self.filepath = target
+        self._dirty = False
+
+    def flush(self, force: bool = False) -> None:
+        """Persist to disk only if mutations happened since the last save.
+
+        Callers mutate freely and flush on a timer, amortizing the encode and
+        fsync cost over many mutations instead of paying it per call.
+        """
+        if (self._dirty or force) and self.filepath:
+            self.save(self.filepath)
 
     @staticmethod
     def load(filepath: Path) -> "RuntimeState":
         if not filepath.exists():
             raise FileNotFoundError(filepath)
-        data = json.loads(filepath.read_text())
+        if ORJSON_AVAILABLE:
+            data = orjson.loads(filepath.read_bytes())
+        else:
+            data = json.loads(filepath.read_text())
+        return RuntimeState.from_dict(data, filepath=filepath)
+
+    def save_binary(self, filepath: Optional[Path] = None) -> None:
+        """Serialize via pickle for the hot autosave path; much faster than text JSON."""
+        target = filepath or self.filepath
+        if not target:
+            raise ValueError("No filepath supplied for saving runtime state.")
+        target = Path(target)
+        write_binary_atomic(target, pickle.dumps(self.to_dict(), protocol=pickle.HIGHEST_PROTOCOL))
+        self.filepath = target
+
+    @staticmethod
+    def load_binary(filepath: Path) -> "RuntimeState":
+        if not filepath.exists():
+            raise FileNotFoundError(filepath)
+        data = pickle.loads(filepath.read_bytes())
         return RuntimeState.from_dict(data, filepath=filepath)
 
     # --- Market management -------------------------------------------
@@ -291,6 +482,7 @@ class RuntimeState:
         self.markets[key] = market
         if key not in self.strategy_priority:
             self.strategy_priority.append(key)
+        self.mark_changed()
 
     def remove_market(self, key: str) -> None:
         market = self.markets.get(key)
@@ -303,6 +495,7 @@ class RuntimeState:
             self.strategy_priority.remove(key)
         if key in self.active_freezes:
             self.active_freezes.pop(key)
+        self.mark_changed()
 
     def market(self, key: str) -> Optional[MarketState]:
         return self.markets.get(key)
@@ -315,18 +508,74 @@ class RuntimeState:
 
     # --- Trade log ---------------------------------------------------
 
+    @staticmethod
+    def _encode_trade(entry: TradeLogEntry) -> bytes:
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(entry.__dict__)
+        return json.dumps(entry.__dict__).encode("utf-8")
+
+    def trade_sidecar_path(self) -> Optional[Path]:
+        if not self.filepath:
+            return None
+        return Path(self.filepath).with_suffix(".ndjson")
+
+    def _rewrite_trade_sidecar(self) -> None:
+        path = self.trade_sidecar_path()
+        if path is None:
+            return
+        if self._trade_sidecar_handle is not None:
+            try:
+                self._trade_sidecar_handle.close()
+            except OSError:
+                pass
+            self._trade_sidecar_handle = None
+        with open(path, "wb") as handle:
+            for entry in self.trade_log:
+                handle.write(self._encode_trade(entry))
+                handle.write(b"\n")
+        self._sidecar_lines = len(self.trade_log)
+        self._trade_sidecar_handle = open(path, "ab")
+
+    def ensure_trade_sidecar(self) -> Optional[Path]:
+        """Return the NDJSON sidecar path, rewriting it if not yet in sync.
+
+        The sidecar mirrors trade_log line-for-line so exports can copy the
+        file verbatim instead of re-serializing every entry.
+        """
+        path = self.trade_sidecar_path()
+        if path is None:
+            return None
+        try:
+            if self._trade_sidecar_handle is None or self._sidecar_lines != len(self.trade_log):
+                self._rewrite_trade_sidecar()
+            else:
+                self._trade_sidecar_handle.flush()
+        except OSError:
+            return None
+        return path
+
     def append_trade(self, entry: TradeLogEntry) -> None:
         self.trade_log.append(entry)
-        if len(self.trade_log) > 5000:
-            self.trade_log = self.trade_log[-5000:]
+        self._dirty = True
+        try:
+            if self._trade_sidecar_handle is None or self._sidecar_lines >= 2 * TRADE_LOG_MAXLEN:
+                # Rewrite drops lines for entries the bounded deque evicted.
+                self._rewrite_trade_sidecar()
+            else:
+                self._trade_sidecar_handle.write(self._encode_trade(entry) + b"\n")
+                self._sidecar_lines += 1
+        except OSError:
+            self._trade_sidecar_handle = None
 
     # --- Freeze management ------------------------------------------
 
     def set_freeze(self, key: str, freeze: FreezeStatus) -> None:
         self.active_freezes[key] = freeze
+        self.mark_changed()
 
     def clear_freeze(self, key: str) -> None:
-        self.active_freezes.pop(key, None)
+        if self.active_freezes.pop(key, None) is not None:
+            self.mark_changed()
 
     def get_freeze(self, key: str) -> Optional[FreezeStatus]:
         freeze = self.active_freezes.get(key)
@@ -339,29 +588,53 @@ class RuntimeState:
 
     # --- Helpers -----------------------------------------------------
 
+    def mark_changed(self) -> None:
+        """Bump the state version so cached derivations (e.g. evaluations) invalidate."""
+        self._version += 1
+        self._dirty = True
+
     def max_data_age_seconds(self) -> float:
         if not self.markets:
             return 0.0
         ages = []
         now = _now()
         for market in self.markets.values():
-            if market.last_fetch_ts:
+            if market._last_fetch_dt is not None:
+                ages.append((now - market._last_fetch_dt).total_seconds())
+            elif market.last_fetch_ts:
                 ages.append((now - _parse_iso(market.last_fetch_ts)).total_seconds())
         return max(ages) if ages else float("inf")
 
     def exposures_by_event(self) -> Dict[str, float]:
-        exposures: Dict[str, float] = {}
-        for market in self.markets.values():
-            exposures.setdefault(market.parent_event_id, 0.0)
-            exposures[market.parent_event_id] += market.market_value()
-        return exposures
+        # Fresh dict: callers (e.g. the engine) mutate it while allocating.
+        self.month_aggregates()
+        return dict(self._event_exposures or {})
 
     def exposures_by_month(self) -> Dict[str, float]:
-        exposures: Dict[str, float] = {}
-        for market in self.markets.values():
-            exposures.setdefault(market.resolution_month(), 0.0)
-            exposures[market.resolution_month()] += market.market_value()
-        return exposures
+        # Fresh dict: callers (e.g. the engine) mutate it while allocating.
+        return dict(self.month_aggregates()[0])
+
+    def month_aggregates(self) -> Tuple[Dict[str, float], Dict[str, int]]:
+        """Exposure and market count per resolution month, cached per state version.
+
+        Event exposures are built in the same pass so each market's value is
+        computed once per version, regardless of how often callers query.
+        """
+        if self._month_aggregates is None or self._month_aggregates_version != self._version:
+            exposures: Dict[str, float] = {}
+            counts: Dict[str, int] = {}
+            events: Dict[str, float] = {}
+            for market in self.markets.values():
+                value = market.market_value()
+                month = market.resolution_month()
+                exposures[month] = exposures.get(month, 0.0) + value
+                counts[month] = counts.get(month, 0) + 1
+                event = market.parent_event_id
+                events[event] = events.get(event, 0.0) + value
+            self._month_aggregates = (exposures, counts)
+            self._event_exposures = events
+            self._month_aggregates_version = self._version
+        return self._month_aggregates
 
     def ensure_cash(self) -> None:
         invested = sum(market.invested_amount() for market in self.markets.values())
@@ -379,29 +652,34 @@ class RuntimeState:
             if key not in self.strategy_priority:
                 self.strategy_priority.append(key)
 
+    @staticmethod
+    def _freeze_to_dict(freeze: FreezeStatus) -> Dict:
+        data = freeze.__dict__.copy()
+        data.pop("_until_dt", None)
+        return data
+
     @staticmethod
     def _market_to_dict(market: MarketState) -> Dict:
-        return {
-            "market_id": market.market_id,
-            "outcome": market.outcome,
-            "question": market.question,
-            "parent_event_id": market.parent_event_id,
-            "parent_event_label": market.parent_event_label,
-            "resolution_datetime": market.resolution_datetime,
-            "resolution_days": market.resolution_days,
-            "metadata": market.metadata,
-            "best_ask": market.best_ask,
-            "best_bid": market.best_bid,
-            "last_price": market.last_price,
-            "last_volume": market.last_volume,
-            "order_book": market.order_book,
-            "price_history": [asdict(sample) for sample in market.price_history],
-            "held_shares": market.held_shares,
-            "average_price": market.average_price,
-            "realized_profit": market.realized_profit,
-            "last_fetch_ts": market.last_fetch_ts,
-            "next_buy_time": market.next_buy_time,
+        # Unchanged markets reuse their previous serialized dict, so a save
+        # only pays for the markets that actually mutated since the last one.
+        if market._snapshot_cache is not None:
+            return market._snapshot_cache
+        # One C-level dict copy instead of ~20 attribute reads per market;
+        # runtime-only caches are stripped before serialization.
+        data = market.__dict__.copy()
+        for key in _MARKET_RUNTIME_FIELDS:
+            del data[key]
+        # Columnar layout: four parallel lists encode far smaller and
+        # faster than 240 per-sample dicts repeating the same keys. Copies
+        # detach the payload from the live ring buffers (NaN -> None for JSON).
+        data["price_history_columns"] = {
+            "timestamp": list(data.pop("_ph_ts")),
+            "best_ask": [_unpack_opt(v) for v in data.pop("_ph_ask")],
+            "best_bid": [_unpack_opt(v) for v in data.pop("_ph_bid")],
+            "volume": [_unpack_opt(v) for v in data.pop("_ph_vol")],
         }
+        market._snapshot_cache = data
+        return data
 
     @staticmethod
     def _market_from_dict(data: Dict) -> MarketState:
@@ -425,15 +703,22 @@ class RuntimeState:
             last_fetch_ts=data.get("last_fetch_ts"),
             next_buy_time=data.get("next_buy_time"),
         )
-        market.price_history = [
-            PriceSample(
-                timestamp=sample["timestamp"],
-                best_ask=sample.get("best_ask"),
-                best_bid=sample.get("best_bid"),
-                volume=sample.get("volume"),
-            )
-            for sample in data.get("price_history", [])
-        ]
+        columns = data.get("price_history_columns")
+        if columns is None:
+            # Legacy row-oriented format: one dict per sample.
+            rows = data.get("price_history", [])
+            columns = {
+                "timestamp": [sample["timestamp"] for sample in rows],
+                "best_ask": [sample.get("best_ask") for sample in rows],
+                "best_bid": [sample.get("best_bid") for sample in rows],
+                "volume": [sample.get("volume") for sample in rows],
+            }
+        offset = max(0, len(columns["timestamp"]) - HISTORY_MAXLEN)
+        market._ph_ts = list(columns["timestamp"][offset:])
+        market._ph_ask = array("f", map(_pack_opt, columns["best_ask"][offset:]))
+        market._ph_bid = array("f", map(_pack_opt, columns["best_bid"][offset:]))
+        market._ph_vol = array("f", map(_pack_opt, columns["volume"][offset:]))
+        market._rebuild_history_index()
         return market
 
 
@@ -4,26 +4,70 @@ UI Components - Reusable widgets for the trading bot interface
 
 from __future__ import annotations
 
+import time
 import tkinter as tk
-from tkinter import ttk
+from collections import deque
+from contextlib import contextmanager
+from itertools import chain
+from tkinter import font as tkfont, ttk
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 
-from src.ui.theme import Theme
+from src.ui.theme import (
+    ACCENT_BLUE,
+    ACCENT_GREEN,
+    ACCENT_RED,
+    ACCENT_YELLOW,
+    BG_HOVER,
+    BG_INPUT,
+    BG_PRIMARY,
+    BG_SECONDARY,
+    BG_TERTIARY,
+    BORDER,
+    TEXT_MUTED,
+    TEXT_PRIMARY,
+    TEXT_SECONDARY,
+)
 
 
 class SmoothScrollText(tk.Frame):
     """A text widget with smooth scrolling for the chat feed - OPTIMIZED."""
     
+    # Shared Font objects and tag specs, built once when the first feed is
+    # constructed (Font needs a Tk root) and reused by every instance so Tk
+    # resolves each font once instead of re-parsing tuples per widget.
+    _FONT_10 = None
+    _FONT_9 = None
+    _FONT_10_BOLD = None
+    _TAG_SPECS = ()
+
+    @classmethod
+    def _ensure_fonts(cls) -> None:
+        if cls._FONT_10 is None:
+            cls._FONT_10 = tkfont.Font(family="Consolas", size=10)
+            cls._FONT_9 = tkfont.Font(family="Consolas", size=9)
+            cls._FONT_10_BOLD = tkfont.Font(family="Consolas", size=10, weight="bold")
+            cls._TAG_SPECS = (
+                ("timestamp", TEXT_MUTED, cls._FONT_9),
+                ("bot", ACCENT_BLUE, None),
+                ("trade", ACCENT_GREEN, None),
+                ("alert", ACCENT_YELLOW, None),
+                ("error", ACCENT_RED, None),
+                ("success", ACCENT_GREEN, None),
+                ("info", TEXT_SECONDARY, None),
+                ("title", TEXT_PRIMARY, cls._FONT_10_BOLD),
+            )
+
     def __init__(self, parent, **kwargs):
-        super().__init__(parent, bg=Theme.BG_SECONDARY)
+        super().__init__(parent, bg=BG_SECONDARY)
+        self._ensure_fonts()
         
         # Create text widget
         self.text = tk.Text(
             self,
-            bg=Theme.BG_SECONDARY,
-            fg=Theme.TEXT_PRIMARY,
-            font=("Consolas", 10),
+            bg=BG_SECONDARY,
+            fg=TEXT_PRIMARY,
+            font=self._FONT_10,
             wrap=tk.WORD,
             relief=tk.FLAT,
             padx=10,
@@ -36,107 +80,221 @@ class SmoothScrollText(tk.Frame):
         
         # Scrollbar
         self.scrollbar = ttk.Scrollbar(self, command=self.text.yview)
-        self.text.configure(yscrollcommand=self.scrollbar.set)
+        self.text.configure(yscrollcommand=self._on_yscroll)
         
         # Layout
         self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         self.text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         
         # Tags for message types
-        self.text.tag_configure("timestamp", foreground=Theme.TEXT_MUTED, font=("Consolas", 9))
-        self.text.tag_configure("bot", foreground=Theme.ACCENT_BLUE)
-        self.text.tag_configure("trade", foreground=Theme.ACCENT_GREEN)
-        self.text.tag_configure("alert", foreground=Theme.ACCENT_YELLOW)
-        self.text.tag_configure("error", foreground=Theme.ACCENT_RED)
-        self.text.tag_configure("success", foreground=Theme.ACCENT_GREEN)
-        self.text.tag_configure("info", foreground=Theme.TEXT_SECONDARY)
-        self.text.tag_configure("title", foreground=Theme.TEXT_PRIMARY, font=("Consolas", 10, "bold"))
-        
-        # Store messages for export - REDUCED for memory
-        self.message_log: List[Dict] = []
+        tag_configure = self.text.tag_configure
+        for name, fg, font in self._TAG_SPECS:
+            if font is None:
+                tag_configure(name, foreground=fg)
+            else:
+                tag_configure(name, foreground=fg, font=font)
+        
+        # Store messages for export; the deque evicts the oldest in O(1).
+        # Logging is off until a consumer opts in via enable_export_log() -
+        # by default every entry would be allocated and then thrown away.
         self.max_messages = 100  # REDUCED: Keep max 100 messages (was 200)
-        self._message_count = 0
-        self._pending_scroll = False
-    
+        self.message_log: deque = deque(maxlen=self.max_messages)
+        self._log_enabled = False
+        # strftime output cached per wall-clock second (bursts share it)
+        self._last_ts_sec = -1
+        self._last_ts_str = ""
+        # Leading+trailing scroll throttle state
+        self._last_scroll_ts = 0.0
+        self._trailing_scheduled = False
+        # True while the view is pinned to the tail; autoscroll pauses when
+        # the user scrolls up to read history.
+        self._at_bottom = True
+        # Messages waiting for the next batched flush into the Text widget
+        self._pending_msgs: List[Tuple[str, str, str, str]] = []
+        self._flush_scheduled = False
+        # Interleaved-args segments of every line currently in the widget;
+        # the deque cap is the widget's line budget.
+        self._rendered: deque = deque(maxlen=self.max_messages)
+        # True while the widget is unlocked; relocked once per idle cycle so
+        # several mutations in the same frame share one NORMAL/DISABLED pair.
+        self._is_editable = False
+
+    @contextmanager
+    def _editable(self):
+        """Unlock the widget on first mutation, relock once on idle.
+
+        Consecutive mutations within the same mainloop iteration reuse the
+        unlocked state instead of toggling NORMAL/DISABLED around each one.
+        """
+        if not self._is_editable:
+            self._is_editable = True
+            self.text.configure(state=tk.NORMAL)
+            self.after_idle(self._lock_text)
+        yield
+
+    def _lock_text(self) -> None:
+        if self._is_editable:
+            self._is_editable = False
+            self.text.configure(state=tk.DISABLED)
+
     def add_message(self, message: str, msg_type: str = "info", title: str = "") -> None:
         """Add a message to the feed - OPTIMIZED for performance."""
-        self._message_count += 1
-        
-        # Batch trim: only check every 20 messages
-        if self._message_count % 20 == 0:
-            self._trim_old_messages()
-        
-        self.text.configure(state=tk.NORMAL)
-        
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        
-        # Store for potential export (lightweight)
-        self.message_log.append({
-            'timestamp': datetime.now().isoformat(),
-            'type': msg_type,
-            'title': title,
-            'message': message,
-        })
-        
-        # Trim message log
-        if len(self.message_log) > self.max_messages:
-            self.message_log = self.message_log[-self.max_messages:]
-        
-        # Add timestamp
-        self.text.insert(tk.END, f"[{timestamp}] ", "timestamp")
-        
-        # Add title if present
-        if title:
-            self.text.insert(tk.END, f"{title}: ", "title")
-        
-        # Add message
-        self.text.insert(tk.END, f"{message}\n", msg_type)
-        
-        self.text.configure(state=tk.DISABLED)
-        
-        # Debounced scroll - only schedule once
-        if not self._pending_scroll:
-            self._pending_scroll = True
-            self.after(50, self._scroll_to_bottom)
+        now_ts = time.time()
+        timestamp = self._format_ts(now_ts)
+        
+        # Store for potential export; the ISO string is built lazily at
+        # export time instead of once per message.
+        if self._log_enabled:
+            self.message_log.append({
+                'ts': now_ts,
+                'type': msg_type,
+                'title': title,
+                'message': message,
+            })
+        
+        # Queue for the batched flush; an idle task still coalesces bursts
+        # arriving in the same mainloop iteration, without the fixed 50ms lag
+        self._pending_msgs.append((timestamp, title, message, msg_type))
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.after_idle(self._flush)
     
-    def _trim_old_messages(self) -> None:
-        """Remove oldest messages from text widget to save memory - AGGRESSIVE."""
-        try:
-            line_count = int(self.text.index('end-1c').split('.')[0])
-            if line_count > 150:  # REDUCED threshold (was 300)
-                self.text.configure(state=tk.NORMAL)
-                self.text.delete('1.0', f'{line_count - 100}.0')
-                self.text.configure(state=tk.DISABLED)
-        except Exception:
-            pass
+    def _format_ts(self, now_ts: float) -> str:
+        sec = int(now_ts)
+        if sec != self._last_ts_sec:
+            self._last_ts_sec = sec
+            self._last_ts_str = time.strftime("%H:%M:%S", time.localtime(sec))
+        return self._last_ts_str
+
+    def add_messages_bulk(self, messages) -> None:
+        """Insert many (message, msg_type, title) tuples in one shot.
+
+        Bulk loads (e.g. restoring history) bypass the flush timer: the whole
+        batch lands in the widget with a single interleaved insert instead of
+        one flush cycle per message.
+        """
+        if not messages:
+            return
+        now_ts = time.time()
+        timestamp = self._format_ts(now_ts)
+        for message, msg_type, title in messages:
+            if self._log_enabled:
+                self.message_log.append({
+                    'ts': now_ts,
+                    'type': msg_type,
+                    'title': title,
+                    'message': message,
+                })
+            if title:
+                segment = (f"[{timestamp}] ", "timestamp", f"{title}: ", "title", f"{message}\n", msg_type)
+            else:
+                segment = (f"[{timestamp}] ", "timestamp", f"{message}\n", msg_type)
+            self._rendered.append(segment)
+        
+        # The ring buffer may have evicted lines: rewrite once from its state
+        with self._editable():
+            self.text.delete("1.0", tk.END)
+            self.text.insert(tk.END, *chain.from_iterable(self._rendered))
+        self._last_scroll_ts = time.monotonic()
+        self.text.see(tk.END)
+
+    def _flush(self) -> None:
+        """Insert all pending messages with one interleaved-args insert call."""
+        self._flush_scheduled = False
+        if not self._pending_msgs:
+            return
+        
+        # Tk's insert accepts (text, tag, text, tag, ...) in a single call
+        new_segments: List[Tuple[str, ...]] = []
+        for timestamp, title, message, msg_type in self._pending_msgs:
+            if title:
+                segment = (f"[{timestamp}] ", "timestamp", f"{title}: ", "title", f"{message}\n", msg_type)
+            else:
+                segment = (f"[{timestamp}] ", "timestamp", f"{message}\n", msg_type)
+            new_segments.append(segment)
+        self._pending_msgs.clear()
+        
+        # Once the line budget is hit, rewrite the widget from the ring
+        # buffer in one shot - no B-tree head deletes, no index parsing.
+        rewrite = len(self._rendered) + len(new_segments) > self.max_messages
+        self._rendered.extend(new_segments)
+        
+        with self._editable():
+            if rewrite:
+                self.text.delete("1.0", tk.END)
+                self.text.insert(tk.END, *chain.from_iterable(self._rendered))
+            else:
+                self.text.insert(tk.END, *chain.from_iterable(new_segments))
+        
+        # Throttled scroll: leading edge scrolls immediately, a trailing
+        # one-shot catches whatever lands inside the 100ms window.
+        if not self._at_bottom:
+            return
+        now = time.monotonic()
+        if now - self._last_scroll_ts > 0.1:
+            self._last_scroll_ts = now
+            self.text.see(tk.END)
+        elif not self._trailing_scheduled:
+            self._trailing_scheduled = True
+            self.after(100, self._trailing_scroll)
     
+    def enable_export_log(self, on: bool = True) -> None:
+        """Opt in to export-log bookkeeping (off by default)."""
+        self._log_enabled = on
+        if not on:
+            self.message_log.clear()
+
     def get_messages_for_export(self) -> List[Dict]:
         """Get messages and clear log."""
-        messages = self.message_log.copy()
-        self.message_log = []
+        messages = [
+            {
+                'timestamp': datetime.fromtimestamp(entry['ts']).isoformat(),
+                'type': entry['type'],
+                'title': entry['title'],
+                'message': entry['message'],
+            }
+            for entry in self.message_log
+        ]
+        self.message_log.clear()
         return messages
     
-    def _scroll_to_bottom(self) -> None:
-        """Scroll to the bottom of the text widget."""
-        self._pending_scroll = False
+    def _on_yscroll(self, first: str, last: str) -> None:
+        """Track whether the view is at the tail while feeding the scrollbar."""
+        self.scrollbar.set(first, last)
+        self._at_bottom = float(last) >= 0.999
+
+    def _trailing_scroll(self) -> None:
+        """Trailing edge of the scroll throttle."""
+        self._trailing_scheduled = False
+        if not self._at_bottom:
+            return
+        self._last_scroll_ts = time.monotonic()
         self.text.see(tk.END)
     
     def clear(self) -> None:
         """Clear all messages."""
-        self.text.configure(state=tk.NORMAL)
-        self.text.delete(1.0, tk.END)
-        self.text.configure(state=tk.DISABLED)
-        self._message_count = 0
+        self._pending_msgs.clear()
+        self._rendered.clear()
+        with self._editable():
+            self.text.delete(1.0, tk.END)
 
 
 class ToolTip:
-    """Creates a tooltip for a given widget with hover delay."""
-    
+    """Creates a tooltip for a given widget with hover delay.
+
+    One hidden Toplevel is shared by every tooltip: at most one is visible
+    at a time, so showing just retargets the shared label and geometry
+    instead of building and destroying widgets per hover.
+    """
+
+    _shared_tw: Optional[tk.Toplevel] = None
+    _shared_label: Optional[tk.Label] = None
+    _owner: Optional["ToolTip"] = None
+
     def __init__(self, widget, text: str, delay: int = 500):
         self.widget = widget
         self.text = text
         self.delay = delay
-        self.tooltip_window = None
         self.scheduled_id = None
         
         widget.bind("<Enter>", self._schedule_tooltip)
@@ -147,55 +305,64 @@ class ToolTip:
         self._hide_tooltip()
         self.scheduled_id = self.widget.after(self.delay, self._show_tooltip)
     
-    def _show_tooltip(self, event=None):
-        if self.tooltip_window:
-            return
-        
-        x = self.widget.winfo_rootx() + 20
-        y = self.widget.winfo_rooty() + self.widget.winfo_height() + 5
-        
-        self.tooltip_window = tw = tk.Toplevel(self.widget)
+    @classmethod
+    def _build_shared_window(cls, master) -> None:
+        cls._shared_tw = tw = tk.Toplevel(master)
+        tw.wm_withdraw()
         tw.wm_overrideredirect(True)
-        tw.wm_geometry(f"+{x}+{y}")
-        tw.configure(bg=Theme.BG_TERTIARY)
+        tw.configure(bg=BG_TERTIARY)
         
         # Create tooltip frame with border effect
-        frame = tk.Frame(tw, bg=Theme.BORDER, padx=1, pady=1)
+        frame = tk.Frame(tw, bg=BORDER, padx=1, pady=1)
         frame.pack()
         
-        inner = tk.Frame(frame, bg=Theme.BG_TERTIARY, padx=8, pady=6)
+        inner = tk.Frame(frame, bg=BG_TERTIARY, padx=8, pady=6)
         inner.pack()
         
-        label = tk.Label(
+        cls._shared_label = tk.Label(
             inner,
-            text=self.text,
+            text="",
             font=("Segoe UI", 9),
-            bg=Theme.BG_TERTIARY,
-            fg=Theme.TEXT_PRIMARY,
+            bg=BG_TERTIARY,
+            fg=TEXT_PRIMARY,
             justify=tk.LEFT,
             wraplength=300,
         )
-        label.pack()
+        cls._shared_label.pack()
+
+    def _show_tooltip(self, event=None):
+        if ToolTip._owner is self:
+            return
+        if ToolTip._shared_tw is None:
+            self._build_shared_window(self.widget)
+        
+        x = self.widget.winfo_rootx() + 20
+        y = self.widget.winfo_rooty() + self.widget.winfo_height() + 5
+        
+        ToolTip._shared_label.configure(text=self.text)
+        ToolTip._shared_tw.wm_geometry(f"+{x}+{y}")
+        ToolTip._shared_tw.wm_deiconify()
+        ToolTip._owner = self
     
     def _hide_tooltip(self, event=None):
         if self.scheduled_id:
             self.widget.after_cancel(self.scheduled_id)
             self.scheduled_id = None
-        if self.tooltip_window:
-            self.tooltip_window.destroy()
-            self.tooltip_window = None
+        if ToolTip._owner is self and ToolTip._shared_tw is not None:
+            ToolTip._shared_tw.wm_withdraw()
+            ToolTip._owner = None
 
 
 class CollapsibleSection(tk.Frame):
     """A collapsible section with header and content."""
     
     def __init__(self, parent, title: str, initially_open: bool = True, **kwargs):
-        super().__init__(parent, bg=Theme.BG_PRIMARY, **kwargs)
+        super().__init__(parent, bg=BG_PRIMARY, **kwargs)
         
         self.is_open = initially_open
         
         # Header frame (clickable)
-        self.header = tk.Frame(self, bg=Theme.BG_TERTIARY, cursor="hand2")
+        self.header = tk.Frame(self, bg=BG_TERTIARY, cursor="hand2")
         self.header.pack(fill=tk.X, pady=(0, 1))
         
         # Arrow indicator
@@ -204,8 +371,8 @@ class CollapsibleSection(tk.Frame):
             self.header,
             textvariable=self.arrow_var,
             font=("Segoe UI", 10),
-            bg=Theme.BG_TERTIARY,
-            fg=Theme.ACCENT_BLUE,
+            bg=BG_TERTIARY,
+            fg=ACCENT_BLUE,
             padx=10,
             pady=8,
         )
@@ -216,32 +383,39 @@ class CollapsibleSection(tk.Frame):
             self.header,
             text=title,
             font=("Segoe UI", 10, "bold"),
-            bg=Theme.BG_TERTIARY,
-            fg=Theme.TEXT_PRIMARY,
+            bg=BG_TERTIARY,
+            fg=TEXT_PRIMARY,
             pady=8,
         )
         self.title_label.pack(side=tk.LEFT)
         
         # Content frame
-        self.content = tk.Frame(self, bg=Theme.BG_SECONDARY, padx=15, pady=10)
+        self.content = tk.Frame(self, bg=BG_SECONDARY, padx=15, pady=10)
         if initially_open:
             self.content.pack(fill=tk.X)
         
-        # Bind click events
-        self.header.bind("<Button-1>", self._toggle)
-        self.arrow.bind("<Button-1>", self._toggle)
-        self.title_label.bind("<Button-1>", self._toggle)
-        
-        # Hover effects
-        self.header.bind("<Enter>", lambda e: self.header.configure(bg=Theme.BG_HOVER))
-        self.header.bind("<Leave>", lambda e: self.header.configure(bg=Theme.BG_TERTIARY))
-        self.arrow.bind("<Enter>", lambda e: self._on_hover(True))
-        self.arrow.bind("<Leave>", lambda e: self._on_hover(False))
-        self.title_label.bind("<Enter>", lambda e: self._on_hover(True))
-        self.title_label.bind("<Leave>", lambda e: self._on_hover(False))
+        # One bindtag shared by header, arrow and title collapses the nine
+        # per-widget bindings into three class bindings.
+        bindtag = f"CollapsibleSection{id(self)}"
+        for widget in (self.header, self.arrow, self.title_label):
+            widget.bindtags((bindtag,) + widget.bindtags())
+        self.header.bind_class(bindtag, "<Button-1>", self._toggle)
+        self.header.bind_class(bindtag, "<Enter>", self._on_enter)
+        self.header.bind_class(bindtag, "<Leave>", self._on_leave)
+        self._hover_bg = BG_TERTIARY
     
+    def _on_enter(self, event=None):
+        self._on_hover(True)
+
+    def _on_leave(self, event=None):
+        self._on_hover(False)
+
     def _on_hover(self, entering: bool):
-        bg = Theme.BG_HOVER if entering else Theme.BG_TERTIARY
+        bg = BG_HOVER if entering else BG_TERTIARY
+        if bg == self._hover_bg:
+            # Crossing between the header and its children: already painted
+            return
+        self._hover_bg = bg
         self.header.configure(bg=bg)
         self.arrow.configure(bg=bg)
         self.title_label.configure(bg=bg)
@@ -262,6 +436,17 @@ class CollapsibleSection(tk.Frame):
 class ConfigEntry(tk.Frame):
     """A single configuration entry with label, input, and tooltip."""
     
+    # Per-type parse/format tables: one dict probe on the hot path instead
+    # of a chain of var_type comparisons, and new types slot in data-side.
+    _PARSE = {
+        "int": int,
+        "float": float,
+        "percent": lambda raw: float(raw.replace("%", "").strip()) / 100.0,
+    }
+    _FMT_SET = {
+        "percent": lambda value: f"{value * 100:.1f}",
+    }
+    
     def __init__(
         self, 
         parent, 
@@ -273,20 +458,21 @@ class ConfigEntry(tk.Frame):
         max_value = None,
         **kwargs
     ):
-        super().__init__(parent, bg=Theme.BG_SECONDARY, **kwargs)
+        super().__init__(parent, bg=BG_SECONDARY, **kwargs)
         
         self.var_type = var_type
         self.min_value = min_value
         self.max_value = max_value
         
-        # Create variable based on type
+        # Checkbuttons need a Tk variable; text entries are queried directly
+        # via Entry.get(), which skips the Variable trace machinery entirely.
         if var_type == "bool":
             self.var = tk.BooleanVar(value=default_value if default_value is not None else False)
         else:
-            self.var = tk.StringVar(value=str(default_value) if default_value is not None else "")
+            self.var = None
         
         # Main row
-        row = tk.Frame(self, bg=Theme.BG_SECONDARY)
+        row = tk.Frame(self, bg=BG_SECONDARY)
         row.pack(fill=tk.X, pady=3)
         
         # Label with tooltip
@@ -294,8 +480,8 @@ class ConfigEntry(tk.Frame):
             row,
             text=label,
             font=("Segoe UI", 9),
-            bg=Theme.BG_SECONDARY,
-            fg=Theme.TEXT_PRIMARY,
+            bg=BG_SECONDARY,
+            fg=TEXT_PRIMARY,
             width=25,
             anchor="w",
         )
@@ -309,23 +495,24 @@ class ConfigEntry(tk.Frame):
             self.input = tk.Checkbutton(
                 row,
                 variable=self.var,
-                bg=Theme.BG_SECONDARY,
-                fg=Theme.TEXT_PRIMARY,
-                activebackground=Theme.BG_SECONDARY,
-                selectcolor=Theme.BG_INPUT,
+                bg=BG_SECONDARY,
+                fg=TEXT_PRIMARY,
+                activebackground=BG_SECONDARY,
+                selectcolor=BG_INPUT,
             )
         else:
             self.input = tk.Entry(
                 row,
-                textvariable=self.var,
                 font=("Consolas", 9),
-                bg=Theme.BG_INPUT,
-                fg=Theme.TEXT_PRIMARY,
-                insertbackground=Theme.TEXT_PRIMARY,
+                bg=BG_INPUT,
+                fg=TEXT_PRIMARY,
+                insertbackground=TEXT_PRIMARY,
                 width=15,
                 relief=tk.FLAT,
             )
-        
+            if default_value is not None:
+                self.input.insert(0, str(default_value))
+
         self.input.pack(side=tk.RIGHT, padx=(5, 0))
     
     def get_value(self):
@@ -333,19 +520,12 @@ class ConfigEntry(tk.Frame):
         if self.var_type == "bool":
             return self.var.get()
         
-        raw = self.var.get().strip()
+        raw = self.input.get().strip()
         if not raw:
             return None
         
         try:
-            if self.var_type == "int":
-                return int(raw)
-            elif self.var_type == "percent":
-                # Remove % if present
-                raw = raw.replace("%", "").strip()
-                return float(raw) / 100.0
-            else:  # float
-                return float(raw)
+            return self._PARSE.get(self.var_type, float)(raw)
         except ValueError:
             return None
     
@@ -353,7 +533,9 @@ class ConfigEntry(tk.Frame):
         """Set the value of the entry."""
         if self.var_type == "bool":
             self.var.set(bool(value))
-        elif self.var_type == "percent" and value is not None:
-            self.var.set(f"{value * 100:.1f}")
-        else:
-            self.var.set(str(value) if value is not None else "")
+            return
+        self.input.delete(0, tk.END)
+        if value is None:
+            return
+        fmt = self._FMT_SET.get(self.var_type)
+        self.input.insert(0, fmt(value) if fmt else str(value))
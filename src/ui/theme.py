@@ -2,39 +2,72 @@
 UI Theme - Color definitions for the trading bot interface
 """
 
+# Module-level constants: LOAD_GLOBAL on these beats LOAD_ATTR on the Theme
+# class in widget-construction loops that reference colors hundreds of times.
+
+# Backgrounds
+BG_PRIMARY = "#0d1117"
+BG_SECONDARY = "#161b22"
+BG_TERTIARY = "#21262d"
+BG_CARD = "#1c2128"
+BG_INPUT = "#0d1117"
+BG_HOVER = "#30363d"
+
+# Accents
+ACCENT_BLUE = "#58a6ff"
+ACCENT_GREEN = "#3fb950"
+ACCENT_RED = "#f85149"
+ACCENT_YELLOW = "#d29922"
+ACCENT_PURPLE = "#a371f7"
+ACCENT_ORANGE = "#db6d28"
+
+# Text
+TEXT_PRIMARY = "#e6edf3"
+TEXT_SECONDARY = "#8b949e"
+TEXT_MUTED = "#6e7681"
+
+# Borders
+BORDER = "#30363d"
+BORDER_LIGHT = "#3d444d"
+
+# Status
+PROFIT = "#3fb950"
+LOSS = "#f85149"
+NEUTRAL = "#8b949e"
+
 
 class Theme:
-    """GitHub-inspired dark theme color palette."""
+    """GitHub-inspired dark theme color palette (class-attribute view)."""
     
     # Backgrounds
-    BG_PRIMARY = "#0d1117"
-    BG_SECONDARY = "#161b22"
-    BG_TERTIARY = "#21262d"
-    BG_CARD = "#1c2128"
-    BG_INPUT = "#0d1117"
-    BG_HOVER = "#30363d"
+    BG_PRIMARY = BG_PRIMARY
+    BG_SECONDARY = BG_SECONDARY
+    BG_TERTIARY = BG_TERTIARY
+    BG_CARD = BG_CARD
+    BG_INPUT = BG_INPUT
+    BG_HOVER = BG_HOVER
     
     # Accents
-    ACCENT_BLUE = "#58a6ff"
-    ACCENT_GREEN = "#3fb950"
-    ACCENT_RED = "#f85149"
-    ACCENT_YELLOW = "#d29922"
-    ACCENT_PURPLE = "#a371f7"
-    ACCENT_ORANGE = "#db6d28"
+    ACCENT_BLUE = ACCENT_BLUE
+    ACCENT_GREEN = ACCENT_GREEN
+    ACCENT_RED = ACCENT_RED
+    ACCENT_YELLOW = ACCENT_YELLOW
+    ACCENT_PURPLE = ACCENT_PURPLE
+    ACCENT_ORANGE = ACCENT_ORANGE
     
     # Text
-    TEXT_PRIMARY = "#e6edf3"
-    TEXT_SECONDARY = "#8b949e"
-    TEXT_MUTED = "#6e7681"
+    TEXT_PRIMARY = TEXT_PRIMARY
+    TEXT_SECONDARY = TEXT_SECONDARY
+    TEXT_MUTED = TEXT_MUTED
     
     # Borders
-    BORDER = "#30363d"
-    BORDER_LIGHT = "#3d444d"
+    BORDER = BORDER
+    BORDER_LIGHT = BORDER_LIGHT
     
     # Status
-    PROFIT = "#3fb950"
-    LOSS = "#f85149"
-    NEUTRAL = "#8b949e"
+    PROFIT = PROFIT
+    LOSS = LOSS
+    NEUTRAL = NEUTRAL
 
 
 # Alias for backward compatibility
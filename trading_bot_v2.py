@@ -11,7 +11,9 @@ Features:
 
 from __future__ import annotations
 
+import collections
 import json
+import sys
 import threading
 import time
 import queue
@@ -39,6 +41,7 @@ from polymarket_api import (
 )
 from runtime_state import parse_volume, extract_parent_event, _now_iso
 from log_manager import LogManager, get_log_manager
+from src.ui.theme import Theme
 
 # Try to import news analyzer
 try:
@@ -64,48 +67,41 @@ LOCK_FILE = _SCRIPT_DIR / ".bot_running.lock"
 
 
 # ============================================================================
-# Color Theme
+# UI Components
 # ============================================================================
 
-class Theme:
-    # Backgrounds
-    BG_PRIMARY = "#0d1117"
-    BG_SECONDARY = "#161b22"
-    BG_TERTIARY = "#21262d"
-    BG_CARD = "#1c2128"
-    BG_INPUT = "#0d1117"
-    BG_HOVER = "#30363d"
-    
-    # Accents
-    ACCENT_BLUE = "#58a6ff"
-    ACCENT_GREEN = "#3fb950"
-    ACCENT_RED = "#f85149"
-    ACCENT_YELLOW = "#d29922"
-    ACCENT_PURPLE = "#a371f7"
-    ACCENT_ORANGE = "#db6d28"
-    
-    # Text
-    TEXT_PRIMARY = "#e6edf3"
-    TEXT_SECONDARY = "#8b949e"
-    TEXT_MUTED = "#6e7681"
-    
-    # Borders
-    BORDER = "#30363d"
-    BORDER_LIGHT = "#3d444d"
-    
-    # Status
-    PROFIT = "#3fb950"
-    LOSS = "#f85149"
-    NEUTRAL = "#8b949e"
+# Display timestamps have second granularity, so the strftime result is
+# cached per wall-clock second and shared by every feed instance.
+_TS_CACHE = [0, ""]
 
 
-# ============================================================================
-# UI Components
-# ============================================================================
-
 class SmoothScrollText(tk.Frame):
-    """A text widget with smooth scrolling for the chat feed - OPTIMIZED."""
-    
+    """A virtualized text feed: only the visible window of lines is rendered.
+
+    The full history lives in a deque; the Text widget holds just the rows
+    that fit the viewport, so insertion and scrolling cost stays flat no
+    matter how long the session runs.
+    """
+
+    # Full scrollback kept in Python; the widget renders a screenful of it.
+    HISTORY_MAXLEN = 1000
+
+    # Live instances, flushed by the app's shared UI tick instead of each
+    # message arming its own after() one-shot.
+    instances: List["SmoothScrollText"] = []
+
+    # Tag specs shared by every instance; configured once per widget.
+    _TAGS = (
+        ("timestamp", {"foreground": Theme.TEXT_MUTED, "font": ("Consolas", 9)}),
+        ("bot", {"foreground": Theme.ACCENT_BLUE}),
+        ("trade", {"foreground": Theme.ACCENT_GREEN}),
+        ("alert", {"foreground": Theme.ACCENT_YELLOW}),
+        ("error", {"foreground": Theme.ACCENT_RED}),
+        ("success", {"foreground": Theme.ACCENT_GREEN}),
+        ("info", {"foreground": Theme.TEXT_SECONDARY}),
+        ("title", {"foreground": Theme.TEXT_PRIMARY, "font": ("Consolas", 10, "bold")}),
+    )
+
     def __init__(self, parent, **kwargs):
         super().__init__(parent, bg=Theme.BG_SECONDARY)
         
@@ -125,109 +121,207 @@ class SmoothScrollText(tk.Frame):
             borderwidth=0,
         )
         
-        # Scrollbar
-        self.scrollbar = ttk.Scrollbar(self, command=self.text.yview)
-        self.text.configure(yscrollcommand=self.scrollbar.set)
+        # Scrollbar drives the virtual window, not the Text widget itself
+        self.scrollbar = ttk.Scrollbar(self, command=self._on_scrollbar)
         
         # Layout
         self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         self.text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         
         # Tags for message types
-        self.text.tag_configure("timestamp", foreground=Theme.TEXT_MUTED, font=("Consolas", 9))
-        self.text.tag_configure("bot", foreground=Theme.ACCENT_BLUE)
-        self.text.tag_configure("trade", foreground=Theme.ACCENT_GREEN)
-        self.text.tag_configure("alert", foreground=Theme.ACCENT_YELLOW)
-        self.text.tag_configure("error", foreground=Theme.ACCENT_RED)
-        self.text.tag_configure("success", foreground=Theme.ACCENT_GREEN)
-        self.text.tag_configure("info", foreground=Theme.TEXT_SECONDARY)
-        self.text.tag_configure("title", foreground=Theme.TEXT_PRIMARY, font=("Consolas", 10, "bold"))
-        
-        # Store messages for export - REDUCED for memory
-        self.message_log: List[Dict] = []
+        for tag, spec in self._TAGS:
+            self.text.tag_configure(tag, **spec)
+
+        # Wheel events scroll the virtual window (the widget has no overflow)
+        self.text.bind("<MouseWheel>", self._on_mousewheel)
+        self.text.bind("<Button-4>", self._on_mousewheel)
+        self.text.bind("<Button-5>", self._on_mousewheel)
+        self.text.bind("<Configure>", lambda e: self._render())
+        # Catch up in one render when the window comes back from the tray
+        self.bind("<Map>", lambda e: self._render())
+
+        # Messages queued for export; drained off-thread by the log cleanup
         self.max_messages = 100  # REDUCED: Keep max 100 messages (was 200)
-        self._message_count = 0
-        self._pending_scroll = False
-    
+        self._export_q: queue.Queue = queue.Queue(maxsize=self.max_messages)
+        # Messages queued for the next batched flush into the Text widget
+        self._pending: collections.deque = collections.deque()
+        # Virtualized scrollback
+        self._lines: collections.deque = collections.deque(maxlen=self.HISTORY_MAXLEN)
+        self._view_top = 0
+        self._follow_tail = True
+        self._line_height: Optional[int] = None
+        # (top, stop, total, version) of the last redraw; unchanged -> skip
+        self._lines_version = 0
+        self._last_render_sig: Optional[Tuple[int, int, int, int]] = None
+        SmoothScrollText.instances.append(self)
+
     def add_message(self, message: str, msg_type: str = "info", title: str = "") -> None:
         """Add a message to the feed - OPTIMIZED for performance."""
-        self._message_count += 1
-        
-        # Batch trim: only check every 20 messages
-        if self._message_count % 20 == 0:
-            self._trim_old_messages()
-        
+        # Interned so repeated types compare/hash by identity downstream
+        msg_type = sys.intern(msg_type)
+        now_s = time.time()
+        second = int(now_s)
+        if _TS_CACHE[0] != second:
+            _TS_CACHE[0] = second
+            _TS_CACHE[1] = datetime.fromtimestamp(second).strftime("%H:%M:%S")
+        timestamp = _TS_CACHE[1]
+
+        # Store for potential export (lightweight); oldest drops when full.
+        # Tuples, not dicts: no per-message hashing or dict overhead on the
+        # hot path - the export drain rebuilds dicts off-thread.
+        entry = (datetime.fromtimestamp(now_s).isoformat(), msg_type, title, message)
+        try:
+            self._export_q.put_nowait(entry)
+        except queue.Full:
+            try:
+                self._export_q.get_nowait()
+            except queue.Empty:
+                pass
+            self._export_q.put_nowait(entry)
+
+        # Queue for the next flush; the app's UI tick drains it once per frame
+        self._pending.append((timestamp, title, message, msg_type))
+
+    def _flush(self) -> None:
+        """Move queued messages into the scrollback and refresh the viewport.
+
+        Called from the app's recurring 50ms UI tick, so a sustained burst
+        costs one render (scroll included) per frame with no per-message
+        scheduler traffic.
+        """
+        if not self._pending:
+            return
+        self._lines.extend(self._pending)
+        self._pending.clear()
+        self._lines_version += 1
+        if not self.winfo_viewable():
+            # Window is withdrawn/iconified: keep collecting, skip Tk work.
+            # The <Map> binding repaints everything in one pass on restore.
+            return
+        if self._follow_tail:
+            self._render()
+        else:
+            # Reader is scrolled up: keep their view, just resize the thumb
+            self._update_scrollbar()
+
+    def _visible_rows(self) -> int:
+        if self._line_height is None:
+            try:
+                from tkinter import font as tkfont
+                self._line_height = tkfont.Font(font=self.text["font"]).metrics("linespace")
+            except tk.TclError:
+                return 20
+        return max(5, self.text.winfo_height() // max(1, self._line_height))
+
+    def _render(self) -> None:
+        """Redraw the visible slice of the scrollback - O(viewport), not O(history)."""
+        total = len(self._lines)
+        rows = self._visible_rows()
+        max_top = max(0, total - rows)
+        if self._follow_tail:
+            self._view_top = max_top
+        else:
+            self._view_top = min(self._view_top, max_top)
+        top = self._view_top
+        stop = min(top + rows, total)
+
+        # Same slice as the last redraw: skip the state toggles and re-insert
+        signature = (top, stop, total, self._lines_version)
+        if signature == self._last_render_sig:
+            return
+        self._last_render_sig = signature
+
+        # One interleaved text/tag argument list -> a single insert round-trip
+        segments: List[str] = []
+        append = segments.extend
+        for index in range(top, stop):
+            timestamp, title, message, msg_type = self._lines[index]
+            append((f"[{timestamp}] ", "timestamp"))
+            if title:
+                append((f"{title}: ", "title"))
+            append((f"{message}\n", msg_type))
+
         self.text.configure(state=tk.NORMAL)
-        
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        
-        # Store for potential export (lightweight)
-        self.message_log.append({
-            'timestamp': datetime.now().isoformat(),
-            'type': msg_type,
-            'title': title,
-            'message': message,
-        })
-        
-        # Trim message log
-        if len(self.message_log) > self.max_messages:
-            self.message_log = self.message_log[-self.max_messages:]
-        
-        # Add timestamp
-        self.text.insert(tk.END, f"[{timestamp}] ", "timestamp")
-        
-        # Add title if present
-        if title:
-            self.text.insert(tk.END, f"{title}: ", "title")
-        
-        # Add message
-        self.text.insert(tk.END, f"{message}\n", msg_type)
-        
+        self.text.delete("1.0", tk.END)
+        if segments:
+            self.text.insert(tk.END, *segments)
         self.text.configure(state=tk.DISABLED)
-        
-        # Debounced scroll - only schedule once
-        if not self._pending_scroll:
-            self._pending_scroll = True
-            self.after(50, self._scroll_to_bottom)
-    
-    def _trim_old_messages(self) -> None:
-        """Remove oldest messages from text widget to save memory - AGGRESSIVE."""
-        try:
-            line_count = int(self.text.index('end-1c').split('.')[0])
-            if line_count > 150:  # REDUCED threshold (was 300)
-                self.text.configure(state=tk.NORMAL)
-                self.text.delete('1.0', f'{line_count - 100}.0')
-                self.text.configure(state=tk.DISABLED)
-        except Exception:
-            pass
-    
+        self._update_scrollbar(total, rows)
+
+    def _update_scrollbar(self, total: Optional[int] = None, rows: Optional[int] = None) -> None:
+        if total is None:
+            total = len(self._lines)
+        if rows is None:
+            rows = self._visible_rows()
+        if total <= rows:
+            self.scrollbar.set(0.0, 1.0)
+        else:
+            self.scrollbar.set(self._view_top / total, min(1.0, (self._view_top + rows) / total))
+
+    def _on_scrollbar(self, action: str, amount: str, units: str = "") -> None:
+        total = len(self._lines)
+        rows = self._visible_rows()
+        if action == "moveto":
+            self._view_top = int(float(amount) * max(0, total - rows))
+        else:  # "scroll" by units or pages
+            step = rows if units == "pages" else 1
+            self._view_top += int(amount) * step
+        self._view_top = max(0, min(self._view_top, max(0, total - rows)))
+        self._follow_tail = self._view_top >= total - rows
+        self._render()
+
+    def _on_mousewheel(self, event) -> str:
+        if getattr(event, "num", None) == 4:
+            delta = -3
+        elif getattr(event, "num", None) == 5:
+            delta = 3
+        else:
+            delta = -3 if event.delta > 0 else 3
+        self._on_scrollbar("scroll", str(delta), "units")
+        return "break"
+
     def get_messages_for_export(self) -> List[Dict]:
-        """Get messages and clear log."""
-        messages = self.message_log.copy()
-        self.message_log = []
-        return messages
-    
-    def _scroll_to_bottom(self) -> None:
-        """Scroll to the bottom of the text widget."""
-        self._pending_scroll = False
-        self.text.see(tk.END)
+        """Drain queued messages; safe to call from the export thread."""
+        entries = []
+        while True:
+            try:
+                entries.append(self._export_q.get_nowait())
+            except queue.Empty:
+                break
+        return [
+            {'timestamp': ts, 'type': msg_type, 'title': title, 'message': message}
+            for ts, msg_type, title, message in entries
+        ]
     
     def clear(self) -> None:
         """Clear all messages."""
-        self.text.configure(state=tk.NORMAL)
-        self.text.delete(1.0, tk.END)
-        self.text.configure(state=tk.DISABLED)
-        self._message_count = 0
+        self._pending.clear()
+        self._lines.clear()
+        self._view_top = 0
+        self._follow_tail = True
+        self._lines_version += 1
+        self._render()
 
 
 class ToolTip:
-    """Creates a tooltip for a given widget with hover delay."""
-    
+    """Creates a tooltip for a given widget with hover delay.
+
+    All tooltips share one hidden Toplevel that is retargeted and shown on
+    hover; building a fresh Toplevel+Frame+Label per hover is far more
+    expensive than reconfiguring the shared one.
+    """
+
+    _shared_tw: Optional[tk.Toplevel] = None
+    _shared_label: Optional[tk.Label] = None
+    _owner: Optional["ToolTip"] = None
+    # Measured window size per tooltip text; repeat hovers skip the
+    # geometry-negotiation pass entirely.
+    _size_cache: Dict[str, Tuple[int, int]] = {}
+
     def __init__(self, widget, text: str, delay: int = 500):
         self.widget = widget
         self.text = text
         self.delay = delay
-        self.tooltip_window = None
         self.scheduled_id = None
         
         widget.bind("<Enter>", self._schedule_tooltip)
@@ -238,16 +332,11 @@ class ToolTip:
         self._hide_tooltip()
         self.scheduled_id = self.widget.after(self.delay, self._show_tooltip)
     
-    def _show_tooltip(self, event=None):
-        if self.tooltip_window:
-            return
-        
-        x = self.widget.winfo_rootx() + 20
-        y = self.widget.winfo_rooty() + self.widget.winfo_height() + 5
-        
-        self.tooltip_window = tw = tk.Toplevel(self.widget)
+    @classmethod
+    def _build_shared_window(cls, master) -> None:
+        cls._shared_tw = tw = tk.Toplevel(master)
+        tw.wm_withdraw()
         tw.wm_overrideredirect(True)
-        tw.wm_geometry(f"+{x}+{y}")
         tw.configure(bg=Theme.BG_TERTIARY)
         
         # Create tooltip frame with border effect
@@ -257,24 +346,43 @@ class ToolTip:
         inner = tk.Frame(frame, bg=Theme.BG_TERTIARY, padx=8, pady=6)
         inner.pack()
         
-        label = tk.Label(
+        cls._shared_label = tk.Label(
             inner,
-            text=self.text,
+            text="",
             font=("Segoe UI", 9),
             bg=Theme.BG_TERTIARY,
             fg=Theme.TEXT_PRIMARY,
             justify=tk.LEFT,
             wraplength=300,
         )
-        label.pack()
+        cls._shared_label.pack()
+
+    def _show_tooltip(self, event=None):
+        if ToolTip._owner is self:
+            return
+        if ToolTip._shared_tw is None:
+            self._build_shared_window(self.widget)
+        
+        x = self.widget.winfo_rootx() + 20
+        y = self.widget.winfo_rooty() + self.widget.winfo_height() + 5
+        
+        ToolTip._shared_label.configure(text=self.text)
+        size = ToolTip._size_cache.get(self.text)
+        if size is None:
+            ToolTip._shared_tw.update_idletasks()
+            size = (ToolTip._shared_tw.winfo_reqwidth(), ToolTip._shared_tw.winfo_reqheight())
+            ToolTip._size_cache[self.text] = size
+        ToolTip._shared_tw.wm_geometry(f"{size[0]}x{size[1]}+{x}+{y}")
+        ToolTip._shared_tw.wm_deiconify()
+        ToolTip._owner = self
     
     def _hide_tooltip(self, event=None):
         if self.scheduled_id:
             self.widget.after_cancel(self.scheduled_id)
             self.scheduled_id = None
-        if self.tooltip_window:
-            self.tooltip_window.destroy()
-            self.tooltip_window = None
+        if ToolTip._owner is self and ToolTip._shared_tw is not None:
+            ToolTip._shared_tw.wm_withdraw()
+            ToolTip._owner = None
 
 
 class CollapsibleSection(tk.Frame):
@@ -318,19 +426,21 @@ class CollapsibleSection(tk.Frame):
         if initially_open:
             self.content.pack(fill=tk.X)
         
-        # Bind click events
-        self.header.bind("<Button-1>", self._toggle)
-        self.arrow.bind("<Button-1>", self._toggle)
-        self.title_label.bind("<Button-1>", self._toggle)
-        
-        # Hover effects
-        self.header.bind("<Enter>", lambda e: self.header.configure(bg=Theme.BG_HOVER))
-        self.header.bind("<Leave>", lambda e: self.header.configure(bg=Theme.BG_TERTIARY))
-        self.arrow.bind("<Enter>", lambda e: self._on_hover(True))
-        self.arrow.bind("<Leave>", lambda e: self._on_hover(False))
-        self.title_label.bind("<Enter>", lambda e: self._on_hover(True))
-        self.title_label.bind("<Leave>", lambda e: self._on_hover(False))
+        # One bindtag covers header, arrow and title: three handlers total
+        # instead of nine per-widget bindings (and their closures).
+        bindtag = f"CollapsibleSection{id(self)}"
+        for widget in (self.header, self.arrow, self.title_label):
+            widget.bindtags((bindtag,) + widget.bindtags())
+        self.header.bind_class(bindtag, "<Button-1>", self._toggle)
+        self.header.bind_class(bindtag, "<Enter>", self._on_enter)
+        self.header.bind_class(bindtag, "<Leave>", self._on_leave)
     
+    def _on_enter(self, event=None):
+        self._on_hover(True)
+
+    def _on_leave(self, event=None):
+        self._on_hover(False)
+
     def _on_hover(self, entering: bool):
         bg = Theme.BG_HOVER if entering else Theme.BG_TERTIARY
         self.header.configure(bg=bg)
@@ -375,6 +485,12 @@ class ConfigEntry(tk.Frame):
             self.var = tk.BooleanVar(value=default_value if default_value is not None else False)
         else:
             self.var = tk.StringVar(value=str(default_value) if default_value is not None else "")
+
+        # Parsed-value cache, invalidated whenever the variable is written
+        self._cached_value = None
+        self._value_dirty = True
+        self._last_raw: Optional[str] = None
+        self.var.trace_add("write", self._mark_value_dirty)
         
         # Main row
         row = tk.Frame(self, bg=Theme.BG_SECONDARY)
@@ -457,23 +573,36 @@ class ConfigEntry(tk.Frame):
                     fg=Theme.TEXT_MUTED,
                 ).pack(side=tk.RIGHT, padx=(0, 5))
     
+    def _mark_value_dirty(self, *args) -> None:
+        self._value_dirty = True
+
     def get_value(self):
-        """Get the current value with proper type conversion."""
+        """Get the current value with proper type conversion (cached until edited)."""
+        if not self._value_dirty:
+            return self._cached_value
+        raw = self.var.get()
+        if raw == self._last_raw:
+            # Rewritten with identical contents (e.g. a form reload): the
+            # trace fired but there is nothing new to parse.
+            self._value_dirty = False
+            return self._cached_value
         try:
             if self.var_type == "bool":
-                return self.var.get()
-            elif self.var_type == "int":
-                return int(self.var.get())
+                value = raw
+            elif self.var_type in ("int", "seconds", "minutes"):
+                value = int(raw)
             elif self.var_type in ("float", "dollar"):
-                return float(self.var.get())
+                value = float(raw)
             elif self.var_type in ("percent",):
-                return float(self.var.get()) / 100.0  # Convert percentage to decimal
-            elif self.var_type in ("seconds", "minutes"):
-                return int(self.var.get())
+                value = float(raw) / 100.0  # Convert percentage to decimal
             else:
-                return self.var.get()
+                value = raw
         except (ValueError, TypeError):
-            return None
+            value = None
+        self._cached_value = value
+        self._last_raw = raw
+        self._value_dirty = False
+        return value
     
     def set_value(self, value):
         """Set the value with proper formatting."""
@@ -551,14 +680,19 @@ class PositionRow(tk.Frame):
         self.on_click = on_click
         
         self.configure(padx=6, pady=4)
-        self.bind("<Enter>", lambda e: self.configure(bg=Theme.BG_HOVER))
-        self.bind("<Leave>", lambda e: self.configure(bg=Theme.BG_CARD))
+        # Bound methods instead of per-row lambdas: one function object per
+        # class, no closures for Tk to retain per card.
+        self.bind("<Enter>", self._on_enter)
+        self.bind("<Leave>", self._on_leave)
         if on_click:
-            self.bind("<Button-1>", lambda e: on_click(trade))
+            self.bind("<Button-1>", self._on_click)
         
         # Compact vertical layout
-        # Row 1: Question (truncated)
-        q_text = trade.question[:30] + "..." if len(trade.question) > 30 else trade.question
+        # Row 1: Question (truncated once per trade, cached across rebuilds)
+        q_text = trade.__dict__.get('_q_trunc30')
+        if q_text is None:
+            q_text = trade.question[:30] + "..." if len(trade.question) > 30 else trade.question
+            trade.__dict__['_q_trunc30'] = q_text
         tk.Label(
             self,
             text=q_text,
@@ -580,10 +714,11 @@ class PositionRow(tk.Frame):
             fg=Theme.TEXT_SECONDARY,
         ).pack(side=tk.LEFT)
         
-        # Current price
+        # Current price (mutable: updated in place on refresh)
+        self._price_var = tk.StringVar(value=f"→${trade.current_price:.2f}")
         tk.Label(
             details_row,
-            text=f"→${trade.current_price:.2f}",
+            textvariable=self._price_var,
             font=("Segoe UI", 7),
             bg=Theme.BG_CARD,
             fg=Theme.TEXT_MUTED,
@@ -596,21 +731,25 @@ class PositionRow(tk.Frame):
         pnl_color = Theme.PROFIT if trade.pnl >= 0 else Theme.LOSS
         pnl_dollar = f"+${trade.pnl:.2f}" if trade.pnl >= 0 else f"-${abs(trade.pnl):.2f}"
         
-        tk.Label(
+        self._pnl_var = tk.StringVar(value=pnl_dollar)
+        self._pnl_label = tk.Label(
             pnl_row,
-            text=pnl_dollar,
+            textvariable=self._pnl_var,
             font=("Segoe UI", 9, "bold"),
             bg=Theme.BG_CARD,
             fg=pnl_color,
-        ).pack(side=tk.LEFT)
+        )
+        self._pnl_label.pack(side=tk.LEFT)
         
-        tk.Label(
+        self._pnl_pct_var = tk.StringVar(value=f"({trade.pnl_pct:+.1f}%)")
+        self._pnl_pct_label = tk.Label(
             pnl_row,
-            text=f"({trade.pnl_pct:+.1f}%)",
+            textvariable=self._pnl_pct_var,
             font=("Segoe UI", 8),
             bg=Theme.BG_CARD,
             fg=pnl_color,
-        ).pack(side=tk.LEFT, padx=(4, 0))
+        )
+        self._pnl_pct_label.pack(side=tk.LEFT, padx=(4, 0))
         
         # Row 4: Sell button (small)
         if on_sell and trade.status == "open":
@@ -625,7 +764,55 @@ class PositionRow(tk.Frame):
                 cursor="hand2",
             )
             sell_btn.pack(anchor="e", pady=(2, 0))
-            sell_btn.bind("<Button-1>", lambda e: on_sell(trade))
+            sell_btn.bind("<Button-1>", self._on_sell)
+        self._grid_pos: Optional[Tuple[int, int]] = None
+        # Trade waiting to be rendered once the card scrolls into view
+        self.pending_trade: Optional[BotTrade] = None
+        # Last-set strings/color; unchanged values skip the Tk variable write
+        self._last_price_s = self._price_var.get()
+        self._last_pnl_s = pnl_dollar
+        self._last_pct_s = self._pnl_pct_var.get()
+        self._last_pnl_color = pnl_color
+    
+    def _on_enter(self, event=None) -> None:
+        self.configure(bg=Theme.BG_HOVER)
+
+    def _on_leave(self, event=None) -> None:
+        self.configure(bg=Theme.BG_CARD)
+
+    def _on_click(self, event=None) -> None:
+        self.on_click(self.trade)
+
+    def _on_sell(self, event=None) -> None:
+        self.on_sell(self.trade)
+
+    def update_trade(self, trade: BotTrade) -> None:
+        """Refresh the mutable fields in place instead of rebuilding the row."""
+        self.trade = trade
+        self.pending_trade = None
+        price_s = f"→${trade.current_price:.2f}"
+        if price_s != self._last_price_s:
+            self._last_price_s = price_s
+            self._price_var.set(price_s)
+        pnl_dollar = f"+${trade.pnl:.2f}" if trade.pnl >= 0 else f"-${abs(trade.pnl):.2f}"
+        if pnl_dollar != self._last_pnl_s:
+            self._last_pnl_s = pnl_dollar
+            self._pnl_var.set(pnl_dollar)
+        pct_s = f"({trade.pnl_pct:+.1f}%)"
+        if pct_s != self._last_pct_s:
+            self._last_pct_s = pct_s
+            self._pnl_pct_var.set(pct_s)
+        pnl_color = Theme.PROFIT if trade.pnl >= 0 else Theme.LOSS
+        if pnl_color != self._last_pnl_color:
+            self._last_pnl_color = pnl_color
+            self._pnl_label.configure(fg=pnl_color)
+            self._pnl_pct_label.configure(fg=pnl_color)
+    
+    def place_in_grid(self, row: int, column: int) -> None:
+        """Grid the card, skipping the Tcl call when the slot is unchanged."""
+        if self._grid_pos != (row, column):
+            self._grid_pos = (row, column)
+            self.grid(row=row, column=column, sticky="nsew", padx=2, pady=2)
 
 
 class MarketRow(tk.Frame):
@@ -644,20 +831,25 @@ class MarketRow(tk.Frame):
         
         self.market_data = market_data
         self.opportunity = opportunity
+        self.on_click = on_click
+        self.on_remove = on_remove
         
         self.configure(padx=10, pady=8)
-        self.bind("<Enter>", lambda e: self.configure(bg=Theme.BG_HOVER))
-        self.bind("<Leave>", lambda e: self.configure(bg=Theme.BG_CARD))
+        self.bind("<Enter>", self._on_enter)
+        self.bind("<Leave>", self._on_leave)
         if on_click:
-            self.bind("<Button-1>", lambda e: on_click(market_data))
+            self.bind("<Button-1>", self._on_click)
         
         # Left side
         left = tk.Frame(self, bg=Theme.BG_CARD)
         left.pack(side=tk.LEFT, fill=tk.X, expand=True)
         
-        # Question
-        question = market_data.get("question", "Unknown")
-        q_text = question[:40] + "..." if len(question) > 40 else question
+        # Question (truncated once per market dict, cached across rebuilds)
+        q_text = market_data.get('_q_trunc40')
+        if q_text is None:
+            question = market_data.get("question", "Unknown")
+            q_text = question[:40] + "..." if len(question) > 40 else question
+            market_data['_q_trunc40'] = q_text
         tk.Label(
             left,
             text=q_text,
@@ -726,8 +918,9 @@ class MarketRow(tk.Frame):
             ).pack(anchor="e")
         
         # Remove button
+        self._remove_btn = None
         if on_remove:
-            remove_btn = tk.Label(
+            self._remove_btn = remove_btn = tk.Label(
                 right,
                 text="✕",
                 font=("Segoe UI", 10),
@@ -736,9 +929,27 @@ class MarketRow(tk.Frame):
                 cursor="hand2",
             )
             remove_btn.pack(anchor="e", pady=(2, 0))
-            remove_btn.bind("<Enter>", lambda e: remove_btn.configure(fg=Theme.ACCENT_RED))
-            remove_btn.bind("<Leave>", lambda e: remove_btn.configure(fg=Theme.TEXT_MUTED))
-            remove_btn.bind("<Button-1>", lambda e: on_remove(market_data))
+            remove_btn.bind("<Enter>", self._on_remove_enter)
+            remove_btn.bind("<Leave>", self._on_remove_leave)
+            remove_btn.bind("<Button-1>", self._on_remove)
+    
+    def _on_enter(self, event=None) -> None:
+        self.configure(bg=Theme.BG_HOVER)
+
+    def _on_leave(self, event=None) -> None:
+        self.configure(bg=Theme.BG_CARD)
+
+    def _on_click(self, event=None) -> None:
+        self.on_click(self.market_data)
+
+    def _on_remove(self, event=None) -> None:
+        self.on_remove(self.market_data)
+
+    def _on_remove_enter(self, event=None) -> None:
+        self._remove_btn.configure(fg=Theme.ACCENT_RED)
+
+    def _on_remove_leave(self, event=None) -> None:
+        self._remove_btn.configure(fg=Theme.TEXT_MUTED)
 
 
 # ============================================================================
@@ -1236,6 +1447,10 @@ class TradingBotApp(tk.Tk):
         
         # Will be populated by update function
         self.ov_category_bars = {}
+
+        # Last rendered (text, fg) per label so the 1s refresh skips the
+        # Tcl configure call when nothing changed (the steady-state case)
+        self._ov_label_cache: Dict[int, Tuple[str, Optional[str]]] = {}
         
         # =====================================================================
         # Initialize timers for countdown display
@@ -1284,6 +1499,23 @@ class TradingBotApp(tk.Tk):
         
         return card
     
+    def _set_label(self, label: tk.Label, text: str, fg: Optional[str] = None) -> None:
+        """Reconfigure a label only when its (text, fg) actually changed.
+
+        The overview refreshes every second; on an idle portfolio every
+        value is identical to the last frame, so diffing against the cache
+        skips the Tcl round-trip and the relayout it would trigger.
+        """
+        key = id(label)
+        state = (text, fg)
+        if self._ov_label_cache.get(key) == state:
+            return
+        self._ov_label_cache[key] = state
+        if fg is None:
+            label.configure(text=text)
+        else:
+            label.configure(text=text, fg=fg)
+
     def _update_overview_display(self) -> None:
         """Update all overview metrics."""
         try:
@@ -1307,94 +1539,98 @@ class TradingBotApp(tk.Tk):
             
             # Update bot status
             if self.bot.is_running():
-                self.overview_status_dot.configure(fg=Theme.ACCENT_GREEN)
-                self.overview_status_text.configure(text="Bot Running", fg=Theme.ACCENT_GREEN)
+                self._set_label(self.overview_status_dot, "●", Theme.ACCENT_GREEN)
+                self._set_label(self.overview_status_text, "Bot Running", Theme.ACCENT_GREEN)
             else:
-                self.overview_status_dot.configure(fg=Theme.TEXT_MUTED)
-                self.overview_status_text.configure(text="Bot Idle", fg=Theme.TEXT_MUTED)
-            
+                self._set_label(self.overview_status_dot, "●", Theme.TEXT_MUTED)
+                self._set_label(self.overview_status_text, "Bot Idle", Theme.TEXT_MUTED)
+
             # Row 1: Starting Capital, Current Value, Total Profit
-            self.ov_starting_card.value_label.configure(text=f"${initial_capital:,.2f}")
-            self.ov_portfolio_card.value_label.configure(text=f"${portfolio_value:,.2f}")
-            
+            self._set_label(self.ov_starting_card.value_label, f"${initial_capital:,.2f}")
+            self._set_label(self.ov_portfolio_card.value_label, f"${portfolio_value:,.2f}")
+
             profit_color = Theme.ACCENT_GREEN if total_profit >= 0 else Theme.ACCENT_RED
             profit_sign = "+" if total_profit >= 0 else ""
-            self.ov_profit_card.value_label.configure(
-                text=f"{profit_sign}${total_profit:,.2f} ({profit_sign}{total_profit_pct:.1f}%)",
-                fg=profit_color
+            self._set_label(
+                self.ov_profit_card.value_label,
+                f"{profit_sign}${total_profit:,.2f} ({profit_sign}{total_profit_pct:.1f}%)",
+                profit_color,
             )
-            
+
             # Row 2: Cash, Positions Value
-            self.ov_cash_card.value_label.configure(text=f"${stats['cash_balance']:,.2f}")
-            self.ov_positions_value_card.value_label.configure(text=f"${positions_value:,.2f}")
-            
+            self._set_label(self.ov_cash_card.value_label, f"${stats['cash_balance']:,.2f}")
+            self._set_label(self.ov_positions_value_card.value_label, f"${positions_value:,.2f}")
+
             # Row 3: Position Stats & Performance
             open_count = len(self.bot.open_trades)
             max_positions = self.bot.config.max_positions
-            self.ov_positions_count_card.value_label.configure(text=f"{open_count} / {max_positions}")
-            
-            self.ov_total_trades_card.value_label.configure(text=str(stats['total_trades']))
-            
+            self._set_label(self.ov_positions_count_card.value_label, f"{open_count} / {max_positions}")
+
+            self._set_label(self.ov_total_trades_card.value_label, str(stats['total_trades']))
+
             win_rate = stats['win_rate']
-            self.ov_win_rate_card.value_label.configure(
-                text=f"{win_rate:.1f}%",
-                fg=Theme.ACCENT_GREEN if win_rate >= 50 else Theme.ACCENT_RED if win_rate > 0 else Theme.TEXT_PRIMARY
+            self._set_label(
+                self.ov_win_rate_card.value_label,
+                f"{win_rate:.1f}%",
+                Theme.ACCENT_GREEN if win_rate >= 50 else Theme.ACCENT_RED if win_rate > 0 else Theme.TEXT_PRIMARY,
             )
-            self.ov_win_rate_card.subtitle_label.configure(
-                text=f"{stats['winning_trades']}W / {stats['losing_trades']}L"
+            self._set_label(
+                self.ov_win_rate_card.subtitle_label,
+                f"{stats['winning_trades']}W / {stats['losing_trades']}L",
             )
-            
+
             # Average P&L of open positions
             if self.bot.open_trades:
                 avg_pnl = sum(t.pnl_pct for t in self.bot.open_trades.values()) / len(self.bot.open_trades) * 100
                 avg_color = Theme.ACCENT_GREEN if avg_pnl >= 0 else Theme.ACCENT_RED
-                self.ov_avg_pnl_card.value_label.configure(
-                    text=f"{avg_pnl:+.1f}%",
-                    fg=avg_color
-                )
+                self._set_label(self.ov_avg_pnl_card.value_label, f"{avg_pnl:+.1f}%", avg_color)
             else:
-                self.ov_avg_pnl_card.value_label.configure(text="—", fg=Theme.TEXT_PRIMARY)
-            
+                self._set_label(self.ov_avg_pnl_card.value_label, "—", Theme.TEXT_PRIMARY)
+
             # Row 4: Best/Worst Performers, Expiring, Alerts
             if self.bot.open_trades:
                 sorted_by_pnl = sorted(self.bot.open_trades.values(), key=lambda t: t.pnl_pct, reverse=True)
-                
+
                 best = sorted_by_pnl[0]
-                self.ov_best_position_card.value_label.configure(
-                    text=f"+{best.pnl_pct*100:.1f}%" if best.pnl_pct >= 0 else f"{best.pnl_pct*100:.1f}%",
-                    fg=Theme.ACCENT_GREEN if best.pnl_pct >= 0 else Theme.ACCENT_RED
+                self._set_label(
+                    self.ov_best_position_card.value_label,
+                    f"+{best.pnl_pct*100:.1f}%" if best.pnl_pct >= 0 else f"{best.pnl_pct*100:.1f}%",
+                    Theme.ACCENT_GREEN if best.pnl_pct >= 0 else Theme.ACCENT_RED,
                 )
-                self.ov_best_position_card.subtitle_label.configure(text=best.question[:30] + "...")
-                
+                self._set_label(self.ov_best_position_card.subtitle_label, best.question[:30] + "...")
+
                 worst = sorted_by_pnl[-1]
-                self.ov_worst_position_card.value_label.configure(
-                    text=f"{worst.pnl_pct*100:+.1f}%",
-                    fg=Theme.ACCENT_GREEN if worst.pnl_pct >= 0 else Theme.ACCENT_RED
+                self._set_label(
+                    self.ov_worst_position_card.value_label,
+                    f"{worst.pnl_pct*100:+.1f}%",
+                    Theme.ACCENT_GREEN if worst.pnl_pct >= 0 else Theme.ACCENT_RED,
                 )
-                self.ov_worst_position_card.subtitle_label.configure(text=worst.question[:30] + "...")
+                self._set_label(self.ov_worst_position_card.subtitle_label, worst.question[:30] + "...")
             else:
-                self.ov_best_position_card.value_label.configure(text="—", fg=Theme.TEXT_PRIMARY)
-                self.ov_best_position_card.subtitle_label.configure(text="No positions")
-                self.ov_worst_position_card.value_label.configure(text="—", fg=Theme.TEXT_PRIMARY)
-                self.ov_worst_position_card.subtitle_label.configure(text="No positions")
-            
+                self._set_label(self.ov_best_position_card.value_label, "—", Theme.TEXT_PRIMARY)
+                self._set_label(self.ov_best_position_card.subtitle_label, "No positions")
+                self._set_label(self.ov_worst_position_card.value_label, "—", Theme.TEXT_PRIMARY)
+                self._set_label(self.ov_worst_position_card.subtitle_label, "No positions")
+
             # Expiring positions
             expiring_24h = 0
             for trade in self.bot.open_trades.values():
                 days_left = getattr(trade, 'resolution_days', 999)
                 if days_left < 1:
                     expiring_24h += 1
-            
-            self.ov_expiring_soon_card.value_label.configure(
-                text=str(expiring_24h),
-                fg=Theme.ACCENT_RED if expiring_24h > 0 else Theme.TEXT_PRIMARY
+
+            self._set_label(
+                self.ov_expiring_soon_card.value_label,
+                str(expiring_24h),
+                Theme.ACCENT_RED if expiring_24h > 0 else Theme.TEXT_PRIMARY,
             )
-            
+
             # Alerts count
             alerts_count = len(self.insider_detector.get_alerts())
-            self.ov_alerts_card.value_label.configure(
-                text=str(alerts_count),
-                fg=Theme.ACCENT_YELLOW if alerts_count > 0 else Theme.TEXT_PRIMARY
+            self._set_label(
+                self.ov_alerts_card.value_label,
+                str(alerts_count),
+                Theme.ACCENT_YELLOW if alerts_count > 0 else Theme.TEXT_PRIMARY,
             )
             
             # Row 8: Category distribution
@@ -1893,7 +2129,7 @@ class TradingBotApp(tk.Tk):
         
         self.chat.add_message(f"🛑 SOLD ALL: Closed {sold} positions", "alert", "Orders")
         self._update_orders_summary()
-        self._update_positions_display()
+        self._schedule_positions_rebuild()
     
     def _order_sell_profitable(self) -> None:
         """Sell all profitable positions."""
@@ -1921,7 +2157,7 @@ class TradingBotApp(tk.Tk):
         
         self.chat.add_message(f"💰 Sold {sold} profitable positions (realized ~${total_pnl:.2f})", "success", "Orders")
         self._update_orders_summary()
-        self._update_positions_display()
+        self._schedule_positions_rebuild()
     
     def _order_sell_losing(self) -> None:
         """Sell all losing positions."""
@@ -1947,7 +2183,7 @@ class TradingBotApp(tk.Tk):
         
         self.chat.add_message(f"📉 Cut losses: Sold {sold} losing positions", "alert", "Orders")
         self._update_orders_summary()
-        self._update_positions_display()
+        self._schedule_positions_rebuild()
     
     def _order_sell_category(self) -> None:
         """Sell all positions in a category."""
@@ -1975,7 +2211,7 @@ class TradingBotApp(tk.Tk):
         
         self.chat.add_message(f"🏷️ Sold {sold} positions in '{category}'", "info", "Orders")
         self._update_orders_summary()
-        self._update_positions_display()
+        self._schedule_positions_rebuild()
     
     def _order_toggle_pause_buys(self) -> None:
         """Toggle pause/resume buying."""
@@ -2016,7 +2252,7 @@ class TradingBotApp(tk.Tk):
             self.chat.add_message("🧹 No stagnant positions found to clear", "info", "Orders")
         
         self._update_orders_summary()
-        self._update_positions_display()
+        self._schedule_positions_rebuild()
     
     def _order_export_positions(self) -> None:
         """Export current positions to CSV."""
@@ -2420,7 +2656,7 @@ class TradingBotApp(tk.Tk):
             state="readonly",
         )
         self.position_sort_menu.pack(side=tk.LEFT, padx=(0, 10))
-        self.position_sort_menu.bind("<<ComboboxSelected>>", lambda e: self._update_positions_display())
+        self.position_sort_menu.bind("<<ComboboxSelected>>", lambda e: self._schedule_positions_rebuild())
         
         self.positions_count = tk.Label(
             sort_frame,
@@ -2444,7 +2680,12 @@ class TradingBotApp(tk.Tk):
         self.positions_frame = tk.Frame(self.positions_canvas, bg=Theme.BG_PRIMARY)
         
         self.positions_window = self.positions_canvas.create_window((0, 0), window=self.positions_frame, anchor="nw")
-        self.positions_canvas.configure(yscrollcommand=scrollbar.set)
+        
+        def on_positions_yscroll(first, last):
+            scrollbar.set(first, last)
+            self._refresh_stale_position_cards()
+        
+        self.positions_canvas.configure(yscrollcommand=on_positions_yscroll)
         
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         self.positions_canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
@@ -3659,7 +3900,7 @@ class TradingBotApp(tk.Tk):
         self.bot._save()
         
         # Update UI
-        self._update_positions_display()
+        self._schedule_positions_rebuild()
         self._update_stats()
         
         # Show result
@@ -4001,7 +4242,7 @@ class TradingBotApp(tk.Tk):
         """Sell a position."""
         if messagebox.askyesno("Confirm Sell", f"Sell position in '{trade.question[:40]}...'?"):
             self.bot.sell_position(trade.id)
-            self._update_positions_display()
+            self._schedule_positions_rebuild()
             self._update_stats()
     
     # =========================================================================
@@ -4034,6 +4275,22 @@ class TradingBotApp(tk.Tk):
             )
             row.pack(fill=tk.X, pady=2)
     
+    def _schedule_positions_rebuild(self) -> None:
+        """Coalesce rebuild requests into one idle-time layout pass.
+
+        Event handlers that close several positions in a burst each ask for
+        a rebuild; scheduling via after_idle runs a single pass after the
+        pending events drain, at Tk's natural redraw boundary.
+        """
+        if getattr(self, "_positions_rebuild_scheduled", False):
+            return
+        self._positions_rebuild_scheduled = True
+        self.after_idle(self._run_positions_rebuild)
+
+    def _run_positions_rebuild(self) -> None:
+        self._positions_rebuild_scheduled = False
+        self._update_positions_display()
+
     def _update_positions_display(self) -> None:
         """Update the positions list with 2-column grid layout."""
         trades = self.bot.get_open_trades()
@@ -4052,36 +4309,75 @@ class TradingBotApp(tk.Tk):
         current_count = len(trades)
         self.positions_count.configure(text=f"{current_count} positions")
         
-        # Always rebuild to show updated P&L values
-        for widget in self.positions_frame.winfo_children():
-            widget.destroy()
+        # Reconcile keyed rows in place instead of destroy-and-recreate
+        rows: Dict[str, PositionRow] = getattr(self, "_position_rows", None)
+        if rows is None:
+            rows = self._position_rows = {}
+            self._positions_placeholder: Optional[tk.Label] = None
         
         if not trades:
-            tk.Label(
-                self.positions_frame,
-                text="No open positions.\nThe bot will show positions here when it trades.",
-                font=("Segoe UI", 10),
-                bg=Theme.BG_PRIMARY,
-                fg=Theme.TEXT_MUTED,
-                pady=30,
-            ).pack()
+            for row in rows.values():
+                row.destroy()
+            rows.clear()
+            if self._positions_placeholder is None:
+                self._positions_placeholder = tk.Label(
+                    self.positions_frame,
+                    text="No open positions.\nThe bot will show positions here when it trades.",
+                    font=("Segoe UI", 10),
+                    bg=Theme.BG_PRIMARY,
+                    fg=Theme.TEXT_MUTED,
+                    pady=30,
+                )
+                self._positions_placeholder.pack()
             return
         
+        if self._positions_placeholder is not None:
+            self._positions_placeholder.destroy()
+            self._positions_placeholder = None
+        
+        # Drop rows whose trades are gone
+        live_ids = {trade.id for trade in trades}
+        for trade_id in [trade_id for trade_id in rows if trade_id not in live_ids]:
+            rows.pop(trade_id).destroy()
+        
         # Configure positions_frame for 2-column grid
         self.positions_frame.grid_columnconfigure(0, weight=1)
         self.positions_frame.grid_columnconfigure(1, weight=1)
         
-        # Place positions in 2-column grid
+        # Place positions in 2-column grid. Only cards inside the scroll
+        # viewport are repainted; off-screen ones remember their trade and
+        # catch up when scrolled into view.
         for i, trade in enumerate(trades):
-            row_idx = i // 2
-            col_idx = i % 2
-            
-            position_card = PositionRow(
-                self.positions_frame,
-                trade,
-                on_sell=self._sell_position,
-            )
-            position_card.grid(row=row_idx, column=col_idx, sticky="nsew", padx=2, pady=2)
+            card = rows.get(trade.id)
+            if card is None:
+                rows[trade.id] = card = PositionRow(
+                    self.positions_frame,
+                    trade,
+                    on_sell=self._sell_position,
+                )
+            elif self._position_card_visible(card):
+                card.update_trade(trade)
+            else:
+                card.pending_trade = trade
+            card.place_in_grid(i // 2, i % 2)
+    
+    def _position_card_visible(self, card: PositionRow) -> bool:
+        """True when the card's y-extent intersects the canvas viewport."""
+        canvas = self.positions_canvas
+        top = canvas.canvasy(0)
+        bottom = canvas.canvasy(canvas.winfo_height())
+        y = card.winfo_y()
+        # One row of buffer on each side keeps scrolling seamless
+        return y + card.winfo_height() >= top - 100 and y <= bottom + 100
+    
+    def _refresh_stale_position_cards(self) -> None:
+        """Repaint cards that scrolled into view with their pending trades."""
+        rows = getattr(self, "_position_rows", None)
+        if not rows:
+            return
+        for card in rows.values():
+            if card.pending_trade is not None and self._position_card_visible(card):
+                card.update_trade(card.pending_trade)
     
     def _update_stats(self) -> None:
         """Update portfolio statistics."""
@@ -4340,7 +4636,7 @@ class TradingBotApp(tk.Tk):
             if messagebox.askyesno("Confirm", "Reset bot? This will clear all trades and positions."):
                 self.bot.reset()
                 self._update_stats()
-                self._update_positions_display()
+                self._schedule_positions_rebuild()
                 self.chat.add_message("Bot has been reset to initial state", "info", "Reset")
                 dialog.destroy()
         
@@ -4419,6 +4715,13 @@ class TradingBotApp(tk.Tk):
         # Start both loops with staggered timing
         self.after(1000, fast_update)   # Fast loop starts after 1s
         self.after(5000, slow_update)   # Slow loop starts after 5s
+        self.after(50, self._ui_tick)   # Shared frame tick for feed widgets
+
+    def _ui_tick(self) -> None:
+        """Recurring 50ms tick draining every feed widget with pending lines."""
+        for feed in SmoothScrollText.instances:
+            feed._flush()
+        self.after(50, self._ui_tick)
     
     def _background_position_update(self) -> None:
         """Update positions in background thread to avoid UI freeze."""
@@ -4534,7 +4837,10 @@ class TradingBotApp(tk.Tk):
             # Convert to JSON-serializable format
             data = {}
             for k, v in self.tracked_markets.items():
-                data[k] = {key: val for key, val in v.items() if key != "metadata"}
+                data[k] = {
+                    key: val for key, val in v.items()
+                    if key != "metadata" and not key.startswith("_")
+                }
             MARKETS_PATH.write_text(json.dumps(data, indent=2))
         except Exception:
             pass